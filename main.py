@@ -46,7 +46,7 @@ class AgapeCoreAI:
         self.gospel_engine = GospelTruthEngine()
         self.gospel_definitions = GospelDefinitions()
         self.nt_analyzer = NTStoryAnalyzer()
-        self.truth_rivers = TruthRivers()
+        self.truth_rivers = TruthRivers(load_examples=True)
         self.limitations = AILimitationsFramework()
         self.seekgood_evaluator = SeekGoodEvaluator()
         self.advice_analyzer = AdviceCredibilityAnalyzer() # Initialize AdviceCredibilityAnalyzer
@@ -797,7 +797,7 @@ def run_truth_rivers_system():
         print("All rivers of truth flow into the ocean of applied wisdom")
         print("-" * 60)
 
-        system = TruthRiversSystem()
+        system = TruthRiversSystem(load_examples=True)
 
         while True:
             print("\n📋 Truth Rivers Options:")
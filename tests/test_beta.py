@@ -0,0 +1,55 @@
+import unittest
+
+from value_theory.beta import ValueImpactCalculator
+
+SCENARIOS = [
+    # (name, utility_per_person, num_people, growth_impact, opportunity_cost)
+    ("President", 362, 345000000, 0, 15000000000),
+    ("Companies", 500, 100000000, 0, 0),
+    ("Charity", 1000, 1000, 500, 0),
+    ("Loss", 1, 10, 0, 100),
+]
+
+
+class ImpactBatchTest(unittest.TestCase):
+    """Batch impacts and decisions must agree with one _impact call per option"""
+
+    def setUp(self):
+        self.calc = ValueImpactCalculator()
+
+    def test_batch_matches_single_impacts(self):
+        _, utilities, people, growth, costs = zip(*SCENARIOS)
+        self.assertEqual(
+            self.calc.calculate_impacts_batch(utilities, people, growth, costs),
+            [self.calc._impact(*scenario[1:]) for scenario in SCENARIOS],
+        )
+
+    def test_batch_defaults_growth_and_cost_to_zero(self):
+        self.assertEqual(self.calc.calculate_impacts_batch([2, 3], [5, 7]), [10, 21])
+        self.assertEqual(self.calc.calculate_impacts_batch([], []), [])
+
+    def test_decide_among_added_options(self):
+        for scenario in SCENARIOS:
+            self.calc.add_option(*scenario)
+        impacts = self.calc.get_all_impacts()
+        self.assertEqual(self.calc.decide_best_option(), max(impacts.items(), key=lambda item: item[1]))
+        self.assertEqual(self.calc.decide_best_option(), self.calc.decide_best_option(list(impacts.items())))
+
+    def test_ties_go_to_first_added_option(self):
+        self.calc.add_option("First", 2, 5)
+        self.calc.add_option("Second", 5, 2)
+        self.assertEqual(self.calc.decide_best_option(), ("First", 10))
+
+    def test_readding_an_option_replaces_it(self):
+        self.calc.add_option("A", 1, 10)
+        self.calc.add_option("B", 2, 10)
+        self.calc.add_option("A", 3, 10)
+        self.assertEqual(self.calc.decide_best_option(), ("A", 30))
+
+    def test_no_options(self):
+        self.assertEqual(self.calc.decide_best_option(), ("None", 0))
+        self.assertEqual(self.calc.decide_best_option([]), ("None", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
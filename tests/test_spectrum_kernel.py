@@ -0,0 +1,98 @@
+import unittest
+
+from truth_foundation._spectrum_kernel import best_positions, score_positions
+from truth_foundation.virtue_spectrum import VirtueSpectrumAnalyzer
+
+
+def reference_scores(action_words, practical_examples):
+    """The per-example word loop the kernel replaced"""
+    scores = []
+    for examples in practical_examples:
+        score = 0.0
+        for example in examples:
+            example_words = example.lower().split()
+            matches = sum(1 for word in example_words if word in action_words)
+            if matches > 0:
+                score += matches / len(example_words)
+        scores.append(score)
+    return tuple(scores)
+
+
+def reference_best(scores):
+    """max() over the position scores, or -1 when nothing matched"""
+    if not scores or max(scores) == 0:
+        return -1
+    return max(range(len(scores)), key=scores.__getitem__)
+
+
+def action_mask(spectrum, action):
+    mask = 0
+    for word in action.lower().split():
+        mask |= spectrum._word_bits.get(word, 0)
+    return mask
+
+
+class SpectrumKernelTest(unittest.TestCase):
+    """score_positions and best_positions must agree with the word loops and max()"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.spectrums = list(VirtueSpectrumAnalyzer().virtue_spectrums.values())
+
+    def actions(self, spectrum):
+        # Every example as an action, plus words drawn from two positions at once
+        for examples in spectrum.practical_examples:
+            yield from examples
+        yield " ".join(spectrum.practical_examples[0] + spectrum.practical_examples[-1])
+        yield "nothing here matches"
+
+    def test_scores_match_word_loop(self):
+        for spectrum in self.spectrums:
+            for action in self.actions(spectrum):
+                with self.subTest(virtue=spectrum.virtue_name, action=action):
+                    scores = score_positions(action_mask(spectrum, action),
+                                             spectrum._example_masks, spectrum._example_lens)
+                    self.assertEqual(scores, reference_scores(set(action.lower().split()),
+                                                              spectrum.practical_examples))
+
+    def test_best_positions_match_max(self):
+        for spectrum in self.spectrums:
+            actions = list(self.actions(spectrum))
+            best = best_positions(
+                tuple(action_mask(spectrum, action) for action in actions),
+                (spectrum._example_masks,) * len(actions),
+                (spectrum._example_lens,) * len(actions),
+            )
+            expected = tuple(
+                reference_best(reference_scores(set(action.lower().split()), spectrum.practical_examples))
+                for action in actions
+            )
+            self.assertEqual(best, expected)
+
+    def test_no_match_returns_minus_one(self):
+        masks = (((0b01,),), ((0b10,),))
+        lens = ((1,), (1,))
+        self.assertEqual(best_positions((0,), (masks,), (lens,)), (-1,))
+        self.assertEqual(best_positions((0b100,), (masks,), (lens,)), (-1,))
+        self.assertEqual(best_positions((0,), ((),), ((),)), (-1,))
+
+    def test_ties_go_to_first_position(self):
+        # Positions 1 and 2 score the same; the first one wins, as with max()
+        masks = ((), ((0b01,),), ((0b10,),), ())
+        lens = ((), (2,), (2,), ())
+        self.assertEqual(score_positions(0b11, masks, lens), (0.0, 0.5, 0.5, 0.0))
+        self.assertEqual(best_positions((0b11,), (masks,), (lens,)), (1,))
+
+    def test_repeated_words_count_per_occurrence(self):
+        # "give give away": the repeated word sets bit 0 in both layers
+        masks = (((0b11, 0b01),),)
+        lens = ((3,),)
+        self.assertEqual(score_positions(0b01, masks, lens), (2 / 3,))
+        self.assertEqual(score_positions(0b11, masks, lens), (1.0,))
+
+    def test_no_spectrums(self):
+        self.assertEqual(best_positions((), (), ()), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
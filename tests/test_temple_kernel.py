@@ -0,0 +1,69 @@
+import unittest
+from itertools import combinations
+
+from truth_foundation._temple_kernel import score_laws
+from truth_foundation.temple_laws import _INDICATOR_BITS, _LAW_INDICATORS, _LAW_MASKS
+
+_LAW_KEYS = tuple(_LAW_INDICATORS) + ("law_without_indicators",)
+_MASKS = tuple(_LAW_MASKS.get(law_name, (0, 0))[0] for law_name in _LAW_KEYS)
+_POPS = tuple(_LAW_MASKS.get(law_name, (0, 0))[1] for law_name in _LAW_KEYS)
+
+
+def reference_scores(person_data):
+    """The per-indicator loop the kernel replaced"""
+    scores = []
+    for law_name in _LAW_KEYS:
+        indicators = _LAW_INDICATORS.get(law_name, [])
+        if not indicators:
+            scores.append(0.5)
+            continue
+        present_indicators = sum(1 for indicator in indicators if person_data.get(indicator, False))
+        scores.append(present_indicators / len(indicators))
+    return tuple(scores)
+
+
+def kernel_scores(person_data):
+    person_mask = 0
+    for indicator, bit in _INDICATOR_BITS.items():
+        if person_data.get(indicator, False):
+            person_mask |= bit
+    return score_laws(person_mask, _MASKS, _POPS)
+
+
+class ScoreLawsTest(unittest.TestCase):
+    """score_laws must agree with the per-indicator loop"""
+
+    def assert_matches_reference(self, person_data):
+        self.assertEqual(kernel_scores(person_data), reference_scores(person_data))
+
+    def test_empty_mask(self):
+        self.assert_matches_reference({})
+        self.assertEqual(score_laws(0, _MASKS, _POPS), (0.0,) * len(_LAW_INDICATORS) + (0.5,))
+
+    def test_all_bits_set(self):
+        self.assert_matches_reference(dict.fromkeys(_INDICATOR_BITS, True))
+        self.assertEqual(score_laws(sum(_INDICATOR_BITS.values()), _MASKS, _POPS), (1.0,) * len(_LAW_INDICATORS) + (0.5,))
+
+    def test_tied_laws(self):
+        person_data = {
+            "follows_commandments": True, "sustains_leaders": True,
+            "daily_prayer": True, "scripture_study": True,
+        }
+        self.assert_matches_reference(person_data)
+        scores = kernel_scores(person_data)
+        self.assertEqual(scores[_LAW_KEYS.index("law_of_obedience")], scores[_LAW_KEYS.index("law_of_gospel")])
+
+    def test_false_indicators_are_absent(self):
+        self.assert_matches_reference(dict.fromkeys(_INDICATOR_BITS, False))
+
+    def test_every_pair_of_indicators(self):
+        for pair in combinations(_INDICATOR_BITS, 2):
+            with self.subTest(indicators=pair):
+                self.assert_matches_reference(dict.fromkeys(pair, True))
+
+    def test_no_laws(self):
+        self.assertEqual(score_laws(0, (), ()), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import gc
+import unittest
+import weakref
+
+from truth_foundation import truth_in_us
+from truth_foundation.truth_in_us import TruthInUsSystem
+
+
+PROBLEMS = [
+    "I struggle with feeling worthless and unloved",
+    "I'm afraid of failing and being rejected",
+    "I feel trapped by addiction and ANGER",
+    "I don't think I'm capable of overcoming my challenges",
+    "",
+    "worth",
+    "less fear",
+]
+
+
+class BatchPrescriptionTest(unittest.TestCase):
+    """generate_prescriptions must agree with one generate_truth_prescription call per problem"""
+
+    def assert_matches_single_calls(self, problems):
+        expected = [TruthInUsSystem().generate_truth_prescription(problem) for problem in problems]
+        self.assertEqual(TruthInUsSystem().generate_prescriptions(problems), expected)
+
+    def test_matches_single_calls(self):
+        self.assert_matches_single_calls(PROBLEMS)
+
+    def test_empty_batch(self):
+        self.assertEqual(TruthInUsSystem().generate_prescriptions([]), [])
+
+    def test_duplicate_problems(self):
+        self.assert_matches_single_calls([PROBLEMS[0], PROBLEMS[2], PROBLEMS[0], PROBLEMS[0]])
+
+    def test_batch_after_warm_cache(self):
+        system = TruthInUsSystem()
+        expected = [system.generate_truth_prescription(problem) for problem in PROBLEMS]
+        self.assertEqual(system.generate_prescriptions(PROBLEMS), expected)
+
+
+class ProblemCacheTest(unittest.TestCase):
+    """Memoized solutions and prescriptions are bounded and do not pin the system"""
+
+    def test_repeated_problem_is_served_from_cache(self):
+        system = TruthInUsSystem()
+        self.assertIs(system.predict_truth_solution(PROBLEMS[0]), system.predict_truth_solution(PROBLEMS[0]))
+        self.assertIs(system.generate_truth_prescription(PROBLEMS[0]),
+                      system.generate_truth_prescription(PROBLEMS[0]))
+
+    def test_caches_are_bounded(self):
+        system = TruthInUsSystem()
+        for i in range(truth_in_us._PROBLEM_CACHE_SIZE + 5):
+            system.generate_truth_prescription(f"fear number {i}")
+        self.assertEqual(len(system._solution_cache), truth_in_us._PROBLEM_CACHE_SIZE)
+        self.assertEqual(len(system._prescription_cache), truth_in_us._PROBLEM_CACHE_SIZE)
+        self.assertNotIn("fear number 0", system._prescription_cache)
+
+    def test_system_is_freed_without_a_gc_pass(self):
+        system = TruthInUsSystem()
+        system.generate_truth_prescription(PROBLEMS[0])
+        ref = weakref.ref(system)
+        gc.disable()
+        try:
+            del system
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+import unittest
+
+from truth_foundation.core_truths import TruthLevel, TruthStatement
+from truth_foundation.truth_rivers import RiverType, TruthFlow, TruthOcean, TruthRiver, TruthRiversSystem
+
+INSUFFICIENT = "Insufficient truth convergence for this context."
+
+
+def relevant_rivers(system, question):
+    return [flow.river_name for flow in system.ocean._find_relevant_flows(question)]
+
+
+class RelevanceTest(unittest.TestCase):
+    """Which flows answer a question: whole case-folded words shared with a flow's content or contexts"""
+
+    def setUp(self):
+        self.system = TruthRiversSystem(load_examples=True)
+
+    def test_demo_questions(self):
+        self.assertEqual(relevant_rivers(self.system, "How should I approach scientific research?"), [])
+        self.assertEqual(self.system.seek_wisdom("How should I approach scientific research?"), INSUFFICIENT)
+        # "making" is a word of the logic flow's "Ethical decision-making" context
+        self.assertEqual(relevant_rivers(self.system, "What should I consider when making important decisions?"),
+                         ["Boolean Logic River"])
+        self.assertEqual(relevant_rivers(self.system, "How do I balance different types of knowledge?"),
+                         ["Boolean Logic River"])
+
+    def test_gravity_question(self):
+        self.assertEqual(relevant_rivers(self.system, "How should I consider gravity in building design?"),
+                         ["Physics River"])
+
+    def test_only_whole_words_match(self):
+        self.assertEqual(relevant_rivers(self.system, "What about DECISION?"), ["Boolean Logic River"])
+        self.assertEqual(relevant_rivers(self.system, "What about decisions?"), [])
+        self.assertEqual(relevant_rivers(self.system, "Should I predicate my life on money?"), [])
+        self.assertNotIn("Physics River", relevant_rivers(self.system, "What is the constant of proportionality?"))
+
+    def test_river_source_is_not_searched(self):
+        # The logic river's source description cites "John 1:1"
+        self.assertEqual(relevant_rivers(self.system, "Tell me about John Lennon"), [])
+
+    def test_unrelated_question_is_insufficient(self):
+        self.assertEqual(self.system.seek_wisdom("How do I bake bread?"), INSUFFICIENT)
+
+
+class FlowTokensTest(unittest.TestCase):
+    """A flow's words are fixed when it is created"""
+
+    def test_flow_tokens_are_whole_case_folded_words(self):
+        flow = TruthFlow(
+            river_name="Test River",
+            truth_content="Boole's Laws of Thought",
+            verification_score=0.9,
+            applicable_contexts=["Ethical decision-making"],
+        )
+        self.assertEqual(flow._tokens,
+                         frozenset({"boole", "s", "laws", "of", "thought", "ethical", "decision", "making"}))
+
+    def test_flow_tokens_leave_out_the_river(self):
+        river = make_river()
+        flow = TruthFlow(
+            river_name=river.name,
+            truth_content="Loads settle",
+            verification_score=0.9,
+            applicable_contexts=[],
+            river_ref=river,
+        )
+        self.assertEqual(flow._tokens, frozenset({"loads", "settle"}))
+
+
+def make_flows():
+    return [
+        TruthFlow(river_name="Physics River", truth_content="Gravity pulls mass together",
+                  verification_score=0.9, applicable_contexts=["Building design"]),
+        TruthFlow(river_name="Boolean Logic River", truth_content="Boole's Laws of Thought",
+                  verification_score=0.8, applicable_contexts=["Decision-making"]),
+        TruthFlow(river_name="Physics River", truth_content="Energy is conserved",
+                  verification_score=0.6, applicable_contexts=["Engineering calculations"]),
+    ]
+
+
+def ocean_state(ocean):
+    return (
+        ocean._verification_totals,
+        ocean._flow_counts,
+        ocean._token_index,
+        ocean.integration_patterns,
+        ocean.truth_convergence_score,
+        ocean._version,
+    )
+
+
+def sequential_ocean(flows):
+    ocean = TruthOcean()
+    for flow in flows:
+        ocean.receive_truth_flow(flow)
+    return ocean
+
+
+class BatchUpdateTest(unittest.TestCase):
+    """A batch must leave the ocean as if its flows arrived one at a time"""
+
+    def test_batch_matches_single_adds(self):
+        flows = make_flows()
+        ocean = TruthOcean()
+        with ocean.batch_update():
+            for flow in flows:
+                ocean.receive_truth_flow(flow)
+        self.assertEqual(ocean_state(ocean), ocean_state(sequential_ocean(flows)))
+
+    def test_nested_batches_settle_once(self):
+        flows = make_flows()
+        ocean = TruthOcean()
+        with ocean.batch_update():
+            ocean.receive_truth_flow(flows[0])
+            with ocean.batch_update():
+                ocean.receive_truth_flow(flows[1])
+            self.assertEqual(ocean.integration_patterns, {})
+            ocean.receive_truth_flow(flows[2])
+        self.assertEqual(ocean_state(ocean), ocean_state(sequential_ocean(flows)))
+
+    def test_exception_leaves_ocean_consistent(self):
+        flows = make_flows()
+        ocean = TruthOcean()
+        with self.assertRaises(RuntimeError):
+            with ocean.batch_update():
+                ocean.receive_truth_flow(flows[0])
+                ocean.receive_truth_flow(flows[1])
+                raise RuntimeError("ingest failed")
+        self.assertEqual(ocean._batch_depth, 0)
+        self.assertEqual(ocean_state(ocean), ocean_state(sequential_ocean(flows[:2])))
+
+        # The ocean keeps working normally after the failed batch
+        ocean.receive_truth_flow(flows[2])
+        self.assertEqual(ocean_state(ocean), ocean_state(sequential_ocean(flows)))
+
+    def test_wisdom_asked_mid_batch_is_not_reused(self):
+        flows = make_flows()
+        ocean = TruthOcean()
+        with ocean.batch_update():
+            for flow in flows:
+                ocean.receive_truth_flow(flow)
+            ocean.generate_applied_wisdom("gravity in building design")
+        self.assertEqual(ocean.generate_applied_wisdom("gravity in building design"),
+                         sequential_ocean(flows).generate_applied_wisdom("gravity in building design"))
+
+    def test_rebuild_integration_patterns(self):
+        flows = make_flows()
+        ocean = sequential_ocean(flows)
+        flows[0].verification_score = 0.5
+        version = ocean._version
+        ocean.rebuild_integration_patterns()
+        self.assertAlmostEqual(ocean.integration_patterns["Physics River"], (0.5 + 0.6) / 2)
+        self.assertAlmostEqual(ocean.integration_patterns["Boolean Logic River"], 0.8)
+        self.assertEqual(ocean._flow_counts, {"Physics River": 2, "Boolean Logic River": 1})
+        self.assertGreater(ocean._version, version)
+
+
+def make_river():
+    return TruthRiver(
+        name="Structural Engineering River",
+        river_type=RiverType.SCIENCE,
+        source_description="Load testing of building materials",
+        truth_contributions=[
+            TruthStatement(
+                statement="Gravity loads must be carried down to the foundation",
+                level=TruthLevel.NATURAL_TRUTH,
+                authority_source="Structural load testing",
+                confidence=0.95,
+                context="Building design on Earth",
+                supporting_evidence=["Load tests"],
+                implications=["Building design", "Foundation sizing"],
+            )
+        ],
+        confidence_level=0.9,
+        earthly_scope=True,
+        atmospheric_scope=False,
+        known_limitations=["Assumes static loads"],
+        verification_methods=["Load testing"],
+    )
+
+
+class ReportCacheTest(unittest.TestCase):
+    """Cached reports must be rebuilt once rivers or flows change"""
+
+    def setUp(self):
+        self.system = TruthRiversSystem(load_examples=True)
+
+    def test_repeated_reports_are_reused(self):
+        self.assertIs(self.system.get_convergence_report(), self.system.get_convergence_report())
+        self.assertIs(self.system.demonstrate_gravity_example(), self.system.demonstrate_gravity_example())
+
+    def test_adding_a_river_changes_the_next_reports(self):
+        report = self.system.get_convergence_report()
+        demo = self.system.demonstrate_gravity_example()
+        self.system.add_truth_river(make_river())
+        self.assertIn("Structural Engineering River", self.system.get_convergence_report())
+        self.assertNotEqual(self.system.get_convergence_report(), report)
+        self.assertIn("Structural Engineering River", self.system.demonstrate_gravity_example())
+        self.assertNotEqual(self.system.demonstrate_gravity_example(), demo)
+
+    def test_adding_a_flow_changes_the_next_reports(self):
+        report = self.system.get_convergence_report()
+        demo = self.system.demonstrate_gravity_example()
+        self.system.ocean.receive_truth_flow(TruthFlow(
+            river_name="Field Notes",
+            truth_content="Gravity settles foundations over time",
+            verification_score=0.7,
+            applicable_contexts=["Building design"],
+        ))
+        self.assertIn("Field Notes", self.system.get_convergence_report())
+        self.assertNotEqual(self.system.get_convergence_report(), report)
+        self.assertIn("Field Notes", self.system.demonstrate_gravity_example())
+        self.assertNotEqual(self.system.demonstrate_gravity_example(), demo)
+
+
+    def test_editing_a_river_changes_the_next_report(self):
+        river = self.system.rivers["physics"]
+        report = self.system.get_convergence_report()
+        river.confidence_level = 0.5
+        self.assertIn("Physics River (physics): 0.50 confidence", self.system.get_convergence_report())
+        river.known_limitations = ["Only tested near Earth"]
+        self.assertIn("Limitation: Only tested near Earth", self.system.get_convergence_report())
+        river.river_type = RiverType.SCIENCE
+        river.atmospheric_scope = False
+        self.assertIn("Physics River (science)", self.system.get_convergence_report())
+        self.assertIn("Scope: Earth\n", self.system.get_convergence_report())
+        self.assertNotEqual(self.system.get_convergence_report(), report)
+
+    def test_replacing_a_river_changes_the_next_report(self):
+        report = self.system.get_convergence_report()
+        self.system.rivers["physics"] = make_river()
+        self.assertIn("Structural Engineering River", self.system.get_convergence_report())
+        self.assertNotIn("Physics River (physics)", self.system.get_convergence_report())
+        self.assertNotEqual(self.system.get_convergence_report(), report)
+
+    def test_removing_a_river_changes_the_next_report(self):
+        self.system.get_convergence_report()
+        del self.system.rivers["mathematics"]
+        self.assertNotIn("Mathematics River", self.system.get_convergence_report())
+
+
+if __name__ == "__main__":
+    unittest.main()
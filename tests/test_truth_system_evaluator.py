@@ -0,0 +1,44 @@
+import gc
+import unittest
+import weakref
+
+from truth_foundation.truth_system_evaluator import TruthSystemEvaluator, TruthSystemType
+
+
+def evaluate(evaluator, practices):
+    return evaluator.evaluate_system("Test System", TruthSystemType.PERSONAL,
+                                     "Built on love, truth and service", practices)
+
+
+class EvaluationCacheTest(unittest.TestCase):
+    """Memoized evaluations are reused, clearable and do not pin the evaluator"""
+
+    def test_repeated_evaluation_is_served_from_cache(self):
+        evaluator = TruthSystemEvaluator()
+        practices = ["daily prayer", "honest work"]
+        first = evaluate(evaluator, practices)
+        self.assertIs(evaluate(evaluator, list(practices)), first)
+        self.assertIsNot(evaluate(evaluator, ["daily prayer"]), first)
+
+    def test_clear_evaluation_cache_recomputes(self):
+        evaluator = TruthSystemEvaluator()
+        first = evaluate(evaluator, ["daily prayer"])
+        evaluator.clear_evaluation_cache()
+        second = evaluate(evaluator, ["daily prayer"])
+        self.assertIsNot(second, first)
+        self.assertEqual(second, first)
+
+    def test_evaluator_is_freed_without_a_gc_pass(self):
+        evaluator = TruthSystemEvaluator()
+        evaluate(evaluator, ["daily prayer"])
+        ref = weakref.ref(evaluator)
+        gc.disable()
+        try:
+            del evaluator
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from dataclasses import FrozenInstanceError
+
+from truth_foundation.virtue_spectrum import VirtueSpectrumAnalyzer
+
+
+class AnalysisCacheTest(unittest.TestCase):
+    """Memoized analyses must not leak changes between callers"""
+
+    def setUp(self):
+        self.analyzer = VirtueSpectrumAnalyzer()
+
+    def test_cached_analyses_are_immutable(self):
+        analysis = self.analyzer.analyze_virtue_spectrum("I give away money we need")[0]
+        with self.assertRaises(FrozenInstanceError):
+            analysis.position_score = 99.0
+        self.assertIsInstance(analysis.recommendations, tuple)
+
+    def test_each_call_gets_its_own_list(self):
+        first = self.analyzer.analyze_virtue_spectrum("I give away money we need")
+        first.append(None)
+        second = self.analyzer.analyze_virtue_spectrum("I give away money we need")
+        self.assertNotIn(None, second)
+
+    def test_context_does_not_change_the_analysis(self):
+        plain = self.analyzer.analyze_virtue_spectrum("I refuse to speak up")
+        with_context = self.analyzer.analyze_virtue_spectrum("I refuse to speak up", {"setting": ["work"]})
+        self.assertEqual(plain, with_context)
+
+    def test_clear_analysis_cache_recomputes(self):
+        first = self.analyzer.analyze_virtue_spectrum("I stand up for truth")
+        self.analyzer.clear_analysis_cache()
+        second = self.analyzer.analyze_virtue_spectrum("I stand up for truth")
+        self.assertEqual(first, second)
+        self.assertIsNot(first[0], second[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+
+"""
+Keyword Trie Patterns
+Factors a fixed keyword vocabulary into a single trie-shaped regex so one
+sweep over a text can find every keyword occurring in it as a substring.
+"""
+
+import re
+from typing import AbstractSet, Dict, FrozenSet, Pattern, Tuple
+
+
+def trie_pattern(words: AbstractSet[str]) -> str:
+    """Build a regex matching the longest of `words` at a position, factored as a trie"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ending here makes the rest optional; greedy matching keeps the longest word
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+def compile_sweep(words: AbstractSet[str]) -> Tuple[Pattern[str], Dict[str, FrozenSet[str]]]:
+    """Compile `words` into a sweep pattern plus a map of each word to the words prefixing it
+
+    The pattern captures the longest word starting at every position of the
+    text; expanding each capture through the map yields every word present.
+    """
+    pattern = re.compile("(?=(" + trie_pattern(words) + "))")
+    prefixes = {
+        word: frozenset(other for other in words if word.startswith(other))
+        for word in words
+    }
+    return pattern, prefixes
@@ -0,0 +1,54 @@
+
+"""
+Virtue Spectrum Scoring Kernel
+Pure integer bitmask arithmetic for scoring an action against the practical
+examples at each spectrum position. Kept free of Python objects so it can be
+compiled ahead of time with mypyc (`mypyc truth_foundation/_spectrum_kernel.py`);
+the compiled module shadows this file when present, otherwise this
+pure-Python version is used.
+"""
+
+from typing import Tuple
+
+
+def score_positions(action_mask: int,
+                    example_masks: Tuple[Tuple[Tuple[int, ...], ...], ...],
+                    example_lens: Tuple[Tuple[int, ...], ...]) -> Tuple[float, ...]:
+    """Score each position as the summed fraction of each example's words set in action_mask
+
+    An example's masks hold the words occurring at least once, twice, ...
+    so repeated words count once per occurrence.
+    """
+    scores = []
+    for i in range(len(example_masks)):
+        score = 0.0
+        masks = example_masks[i]
+        lens = example_lens[i]
+        for j in range(len(masks)):
+            matches = 0
+            for mask in masks[j]:
+                matches += (action_mask & mask).bit_count()
+            if matches > 0:
+                score += matches / lens[j]
+        scores.append(score)
+    return tuple(scores)
+
+
+def best_positions(action_masks: Tuple[int, ...],
+                   spectrum_example_masks: Tuple[Tuple[Tuple[Tuple[int, ...], ...], ...], ...],
+                   spectrum_example_lens: Tuple[Tuple[Tuple[int, ...], ...], ...]) -> Tuple[int, ...]:
+    """Index of the highest scoring position for each spectrum, or -1 when no position scores
+
+    Ties go to the lowest index, matching max() over the position scores.
+    """
+    best = []
+    for k in range(len(action_masks)):
+        scores = score_positions(action_masks[k], spectrum_example_masks[k], spectrum_example_lens[k])
+        best_index = -1
+        best_score = 0.0
+        for i in range(len(scores)):
+            if scores[i] > best_score:
+                best_score = scores[i]
+                best_index = i
+        best.append(best_index)
+    return tuple(best)
@@ -0,0 +1,24 @@
+
+"""
+Temple Law Scoring Kernel
+Pure integer bitmask arithmetic for temple law observance scores.
+Kept free of Python objects so it can be compiled ahead of time with
+mypyc (`mypyc truth_foundation/_temple_kernel.py`); the compiled module
+shadows this file when present, otherwise this pure-Python version is used.
+"""
+
+from typing import Tuple
+
+
+def score_laws(person_mask: int,
+               law_masks: Tuple[int, ...],
+               law_pops: Tuple[int, ...]) -> Tuple[float, ...]:
+    """Score each law as the fraction of its indicator bits set in person_mask"""
+    scores = []
+    for i in range(len(law_masks)):
+        pop = law_pops[i]
+        if pop == 0:
+            scores.append(0.5)
+        else:
+            scores.append((person_mask & law_masks[i]).bit_count() / pop)
+    return tuple(scores)
@@ -6,33 +6,94 @@ and progression toward becoming like God through Christ's Atonement
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
-from .core_truths import TruthStatement, TruthLevel
+from typing import Dict, List, Optional, Any, Tuple
 from .atonement_supreme import AtonementSupremeTruth
-import logging
+from ._temple_kernel import score_laws
 
-logger = logging.getLogger(__name__)
+# Static sections of the temple law guidance report
+_HEADER_RULE = "=" * 60
+_GUIDANCE_PREAMBLE = (
+    "🏛️ TEMPLE LAW GUIDANCE\n"
+    "Sacred Covenants and Eternal Progression\n"
+    f"{_HEADER_RULE}\n\n"
+)
+_REMEMBER_BLOCK = (
+    "📖 REMEMBER:\n"
+    "Temple covenants are the pathway to eternal life and exaltation.\n"
+    "Through Christ's Atonement, you can become joint-heirs with Him\n"
+    "and inherit all that the Father has. Stay faithful to your covenants!\n\n"
+)
+_PROMISE_BLOCK = (
+    "🕊️ ULTIMATE PROMISE:\n"
+    "\"Then shall they be gods, because they have no end; therefore shall they be\n"
+    "from everlasting to everlasting, because they continue\" - D&C 132:20\n"
+)
 
-@dataclass
+# Baseline recommendations by covenant faithfulness band
+_REC_HIGH = (
+    "Continue faithful covenant keeping - you're on the path to exaltation",
+    "Look for opportunities to help others make and keep temple covenants"
+)
+_REC_MID = (
+    "Good foundation in covenant living - focus on areas needing growth",
+    "Increase temple attendance for spiritual strength"
+)
+_REC_LOW = (
+    "Begin with basics: daily prayer, scripture study, and obedience",
+    "Prepare worthily for temple worship and covenant making"
+)
+
+# Growth recommendations keyed by the raw temple law key
+_GROWTH_AREA_RECS = {
+    "law_of_obedience": "Focus on complete obedience to all commandments",
+    "law_of_sacrifice": "Practice consecration by sacrificing for others",
+    "law_of_chastity": "Strengthen moral purity in thought and action",
+    "law_of_consecration": "Use talents and resources to build God's kingdom"
+}
+
+# Observable indicators of living each temple law
+_LAW_INDICATORS = {
+    "law_of_obedience": ("follows_commandments", "sustains_leaders", "faithful_service"),
+    "law_of_sacrifice": ("pays_tithing", "serves_missions", "sacrifices_for_others"),
+    "law_of_gospel": ("daily_prayer", "scripture_study", "sacrament_attendance"),
+    "law_of_chastity": ("moral_purity", "marital_fidelity", "appropriate_thoughts"),
+    "law_of_consecration": ("serves_others", "uses_talents_for_good", "consecrated_living"),
+    "broken_heart_contrite_spirit": ("humble", "repentant", "submissive_to_god")
+}
+
+# Bitmask encoding of the indicators for the scoring kernel
+_INDICATOR_BITS = {
+    indicator: 1 << bit
+    for bit, indicator in enumerate(
+        dict.fromkeys(ind for inds in _LAW_INDICATORS.values() for ind in inds)
+    )
+}
+_INDICATOR_BIT_PAIRS = tuple(_INDICATOR_BITS.items())
+_LAW_MASKS = {
+    law_name: (sum(_INDICATOR_BITS[ind] for ind in set(inds)), len(set(inds)))
+    for law_name, inds in _LAW_INDICATORS.items()
+}
+
+@dataclass(slots=True)
 class TempleLaw:
     """A sacred law or principle taught in the temple"""
     law_name: str
     description: str
-    scripture_references: List[str]
-    covenant_requirements: List[str]
-    blessings_promised: List[str]
-    practical_applications: List[str]
+    scripture_references: Tuple[str, ...]
+    covenant_requirements: Tuple[str, ...]
+    blessings_promised: Tuple[str, ...]
+    practical_applications: Tuple[str, ...]
     christ_connection: str
     progression_toward_godhood: str
 
-@dataclass
+@dataclass(slots=True)
 class TempleAssessment:
     """Assessment of temple law observance and progression"""
-    laws_being_lived: List[str]
-    areas_for_growth: List[str]
+    laws_being_lived: Tuple[str, ...]
+    areas_for_growth: Tuple[str, ...]
     covenant_faithfulness_score: float
     progression_score: float
-    recommendations: List[str]
+    recommendations: Tuple[str, ...]
     eternal_perspective: str
 
 class TempleLawsFramework:
@@ -45,6 +106,15 @@ class TempleLawsFramework:
         self.atonement_truth = AtonementSupremeTruth()
         self.temple_laws = self._initialize_temple_laws()
         self.progression_levels = self._initialize_progression_levels()
+        
+        # Resolve kernel tables once; laws without indicators score 0.5
+        self._law_keys = tuple(self.temple_laws)
+        law_masks = [_LAW_MASKS.get(law_name, (0, 0)) for law_name in self._law_keys]
+        self._law_masks = tuple(mask for mask, _ in law_masks)
+        self._law_pops = tuple(pop for _, pop in law_masks)
+        
+        # The law table is fixed after construction, so the summary is too
+        self.temple_laws_summary = self._build_all_laws_summary()
     
     def _initialize_temple_laws(self) -> Dict[str, TempleLaw]:
         """Initialize sacred temple laws and principles"""
@@ -52,29 +122,29 @@ class TempleLawsFramework:
             "law_of_obedience": TempleLaw(
                 law_name="Law of Obedience",
                 description="Complete obedience to God's commandments and His anointed servants",
-                scripture_references=[
+                scripture_references=(
                     "D&C 130:20-21 - 'There is a law, irrevocably decreed... upon which all blessings are predicated'",
                     "1 Samuel 15:22 - 'To obey is better than sacrifice'",
                     "D&C 82:10 - 'I, the Lord, am bound when ye do what I say'"
-                ],
-                covenant_requirements=[
+                ),
+                covenant_requirements=(
                     "Willingness to obey all of God's commandments",
                     "Submission to priesthood authority",
                     "Faithful observance of all Gospel ordinances",
                     "Complete dedication to building God's kingdom"
-                ],
-                blessings_promised=[
+                ),
+                blessings_promised=(
                     "All blessings predicated upon obedience",
                     "Divine protection and guidance",
                     "Spiritual power and authority",
                     "Progress toward eternal life"
-                ],
-                practical_applications=[
+                ),
+                practical_applications=(
                     "Keep all commandments without picking and choosing",
                     "Sustain Church leaders and follow prophetic counsel",
                     "Attend church and fulfill callings faithfully",
                     "Live Gospel principles in all aspects of life"
-                ],
+                ),
                 christ_connection="Christ was perfectly obedient to the Father in all things",
                 progression_toward_godhood="Obedience is the first law of heaven - essential for godhood"
             ),
@@ -82,29 +152,29 @@ class TempleLawsFramework:
             "law_of_sacrifice": TempleLaw(
                 law_name="Law of Sacrifice",
                 description="Willingness to sacrifice all things for the Gospel, even life if necessary",
-                scripture_references=[
+                scripture_references=(
                     "Lectures on Faith 6:7 - 'A religion that does not require the sacrifice of all things never has power sufficient to produce the faith necessary unto life and salvation'",
                     "Luke 14:26 - 'If any man come to me, and hate not... his own life also, he cannot be my disciple'",
                     "D&C 98:13 - 'It is my will that you should forsake all evil and cleave unto all good'"
-                ],
-                covenant_requirements=[
+                ),
+                covenant_requirements=(
                     "Consecrate all possessions to the Lord",
                     "Put God's kingdom before personal interests",
                     "Willingness to give up anything God requires",
                     "Sacrifice time, talents, and resources for others"
-                ],
-                blessings_promised=[
+                ),
+                blessings_promised=(
                     "Faith sufficient for eternal life",
                     "Power to overcome all obstacles",
                     "Spiritual strength and testimony",
                     "Eternal rewards and inheritance"
-                ],
-                practical_applications=[
+                ),
+                practical_applications=(
                     "Pay tithes and offerings generously",
                     "Serve missions and callings despite cost",
                     "Put family and Gospel before career advancement",
                     "Live modestly and share with those in need"
-                ],
+                ),
                 christ_connection="Christ sacrificed His life and all things for our salvation",
                 progression_toward_godhood="Gods must be willing to sacrifice all for their children"
             ),
@@ -112,29 +182,29 @@ class TempleLawsFramework:
             "law_of_gospel": TempleLaw(
                 law_name="Law of the Gospel",
                 description="Living by faith, repentance, baptism, and receiving the Holy Ghost",
-                scripture_references=[
+                scripture_references=(
                     "3 Nephi 27:13-21 - Christ's definition of His Gospel",
                     "2 Nephi 31:17-21 - The doctrine of Christ",
                     "D&C 84:27 - 'The power of godliness is manifest'"
-                ],
-                covenant_requirements=[
+                ),
+                covenant_requirements=(
                     "Exercise faith in Jesus Christ",
                     "Repent of all sins continually",
                     "Honor baptismal covenant daily",
                     "Follow promptings of the Holy Ghost"
-                ],
-                blessings_promised=[
+                ),
+                blessings_promised=(
                     "Remission of sins",
                     "Born again through the Spirit",
                     "Power of godliness manifest",
                     "Eternal life through Christ"
-                ],
-                practical_applications=[
+                ),
+                practical_applications=(
                     "Daily prayer and scripture study",
                     "Weekly sacrament participation",
                     "Regular repentance and course correction",
                     "Seek and follow spiritual promptings"
-                ],
+                ),
                 christ_connection="Christ is the Gospel - the way, truth, and life",
                 progression_toward_godhood="The Gospel is the path to become like Christ"
             ),
@@ -142,29 +212,29 @@ class TempleLawsFramework:
             "law_of_chastity": TempleLaw(
                 law_name="Law of Chastity",
                 description="Sexual purity and fidelity according to God's design for eternal families",
-                scripture_references=[
+                scripture_references=(
                     "1 Corinthians 6:18-20 - 'Flee fornication... glorify God in your body'",
                     "D&C 42:22-24 - 'Thou shalt love thy wife with all thy heart'",
                     "The Family: A Proclamation to the World"
-                ],
-                covenant_requirements=[
+                ),
+                covenant_requirements=(
                     "Sexual relations only within legal marriage",
                     "Complete fidelity to spouse",
                     "Purity in thought, word, and deed",
                     "Respect the sacred power of procreation"
-                ],
-                blessings_promised=[
+                ),
+                blessings_promised=(
                     "Strong eternal marriage and family",
                     "Spiritual sensitivity and power",
                     "Self-respect and divine approval",
                     "Ability to create eternal families"
-                ],
-                practical_applications=[
+                ),
+                practical_applications=(
                     "Guard thoughts and avoid tempting situations",
                     "Honor marriage covenants completely",
                     "Teach children proper principles",
                     "Support and strengthen families"
-                ],
+                ),
                 christ_connection="Christ's pure love provides the pattern for marital love",
                 progression_toward_godhood="Eternal marriage is essential for exaltation and godhood"
             ),
@@ -172,29 +242,29 @@ class TempleLawsFramework:
             "law_of_consecration": TempleLaw(
                 law_name="Law of Consecration",
                 description="Complete dedication of time, talents, and possessions to God's kingdom",
-                scripture_references=[
+                scripture_references=(
                     "D&C 42:30-32 - 'All things shall be done with an eye single to the glory of God'",
                     "D&C 78:17-18 - 'The earth is the Lord's, and the fulness thereof'",
                     "Mosiah 2:17 - 'When ye are in the service of your fellow beings ye are only in the service of your God'"
-                ],
-                covenant_requirements=[
+                ),
+                covenant_requirements=(
                     "Consecrate all possessions to the Lord",
                     "Use talents and abilities to build the kingdom",
                     "Serve others with pure motives",
                     "Have no selfish ambitions"
-                ],
-                blessings_promised=[
+                ),
+                blessings_promised=(
                     "Fulness of the earth",
                     "Spiritual and temporal prosperity",
                     "Unity with God's purposes",
                     "Eternal inheritance and exaltation"
-                ],
-                practical_applications=[
+                ),
+                practical_applications=(
                     "Use all resources to bless others",
                     "Magnify callings and opportunities to serve",
                     "Live United Order principles in heart",
                     "See all possessions as stewardships from God"
-                ],
+                ),
                 christ_connection="Christ consecrated His entire life and mission to the Father",
                 progression_toward_godhood="Gods live the law of consecration perfectly"
             ),
@@ -202,29 +272,29 @@ class TempleLawsFramework:
             "broken_heart_contrite_spirit": TempleLaw(
                 law_name="Broken Heart and Contrite Spirit",
                 description="Complete humility, surrender to God's will, and spiritual rebirth",
-                scripture_references=[
+                scripture_references=(
                     "3 Nephi 9:20 - 'Offer for a sacrifice unto me a broken heart and a contrite spirit'",
                     "2 Nephi 2:7 - 'Redemption cometh through the Holy Messiah'",
                     "Psalm 51:17 - 'A broken and a contrite heart, O God, thou wilt not despise'"
-                ],
-                covenant_requirements=[
+                ),
+                covenant_requirements=(
                     "Complete humility before God",
                     "Surrender personal will to God's will",
                     "Genuine sorrow for sin",
                     "Willingness to be spiritually reborn"
-                ],
-                blessings_promised=[
+                ),
+                blessings_promised=(
                     "Spiritual rebirth and renewal",
                     "Remission of sins",
                     "Peace of conscience",
                     "Power to overcome natural man"
-                ],
-                practical_applications=[
+                ),
+                practical_applications=(
                     "Daily examination of conscience",
                     "Sincere confession and repentance",
                     "Submit to God's timing and methods",
                     "Accept trials as refining experiences"
-                ],
+                ),
                 christ_connection="Christ suffered with perfect submission to enable our redemption",
                 progression_toward_godhood="Broken heart precedes spiritual rebirth necessary for godhood"
             )
@@ -260,17 +330,24 @@ class TempleLawsFramework:
         
         laws_being_lived = []
         areas_for_growth = []
+        growth_keys = []
         total_score = 0.0
         
-        # Evaluate each temple law
-        for law_name, law in self.temple_laws.items():
-            score = self._evaluate_law_observance(law_name, person_data)
+        # Evaluate each temple law in one kernel pass
+        person_mask = 0
+        for indicator, bit in _INDICATOR_BIT_PAIRS:
+            if person_data.get(indicator, False):
+                person_mask |= bit
+        
+        law_scores = score_laws(person_mask, self._law_masks, self._law_pops)
+        for law_name, score in zip(self._law_keys, law_scores):
             total_score += score
             
             if score > 0.7:
                 laws_being_lived.append(law_name.replace('_', ' ').title())
             elif score < 0.5:
                 areas_for_growth.append(law_name.replace('_', ' ').title())
+                growth_keys.append(law_name)
         
         covenant_faithfulness = total_score / len(self.temple_laws)
         
@@ -286,66 +363,39 @@ class TempleLawsFramework:
         
         # Generate recommendations
         recommendations = self._generate_temple_recommendations(
-            covenant_faithfulness, areas_for_growth, person_data
+            covenant_faithfulness, growth_keys, person_data
         )
         
         # Generate eternal perspective
         eternal_perspective = self._generate_eternal_perspective(covenant_faithfulness)
         
         return TempleAssessment(
-            laws_being_lived=laws_being_lived,
-            areas_for_growth=areas_for_growth,
+            laws_being_lived=tuple(laws_being_lived),
+            areas_for_growth=tuple(areas_for_growth),
             covenant_faithfulness_score=covenant_faithfulness,
             progression_score=progression,
-            recommendations=recommendations,
+            recommendations=tuple(recommendations),
             eternal_perspective=eternal_perspective
         )
     
-    def _evaluate_law_observance(self, law_name: str, person_data: Dict[str, Any]) -> float:
-        """Evaluate observance of a specific temple law"""
-        
-        law_indicators = {
-            "law_of_obedience": ["follows_commandments", "sustains_leaders", "faithful_service"],
-            "law_of_sacrifice": ["pays_tithing", "serves_missions", "sacrifices_for_others"],
-            "law_of_gospel": ["daily_prayer", "scripture_study", "sacrament_attendance"],
-            "law_of_chastity": ["moral_purity", "marital_fidelity", "appropriate_thoughts"],
-            "law_of_consecration": ["serves_others", "uses_talents_for_good", "consecrated_living"],
-            "broken_heart_contrite_spirit": ["humble", "repentant", "submissive_to_god"]
-        }
-        
-        indicators = law_indicators.get(law_name, [])
-        if not indicators:
-            return 0.5
-        
-        present_indicators = sum(1 for indicator in indicators if person_data.get(indicator, False))
-        return present_indicators / len(indicators)
-    
     def _generate_temple_recommendations(self, faithfulness_score: float, 
                                        growth_areas: List[str], 
                                        person_data: Dict[str, Any]) -> List[str]:
-        """Generate specific recommendations for temple law living"""
-        recommendations = []
+        """Generate specific recommendations for temple law living
         
+        growth_areas holds raw temple law keys (e.g. "law_of_obedience").
+        """
         if faithfulness_score > 0.8:
-            recommendations.append("Continue faithful covenant keeping - you're on the path to exaltation")
-            recommendations.append("Look for opportunities to help others make and keep temple covenants")
+            recommendations = list(_REC_HIGH)
         elif faithfulness_score > 0.6:
-            recommendations.append("Good foundation in covenant living - focus on areas needing growth")
-            recommendations.append("Increase temple attendance for spiritual strength")
+            recommendations = list(_REC_MID)
         else:
-            recommendations.append("Begin with basics: daily prayer, scripture study, and obedience")
-            recommendations.append("Prepare worthily for temple worship and covenant making")
+            recommendations = list(_REC_LOW)
         
         # Specific recommendations for growth areas
-        for area in growth_areas[:2]:
-            if "obedience" in area.lower():
-                recommendations.append("Focus on complete obedience to all commandments")
-            elif "sacrifice" in area.lower():
-                recommendations.append("Practice consecration by sacrificing for others")
-            elif "chastity" in area.lower():
-                recommendations.append("Strengthen moral purity in thought and action")
-            elif "consecration" in area.lower():
-                recommendations.append("Use talents and resources to build God's kingdom")
+        recommendations.extend(
+            _GROWTH_AREA_RECS[key] for key in growth_areas[:2] if key in _GROWTH_AREA_RECS
+        )
         
         return recommendations
     
@@ -364,43 +414,31 @@ class TempleLawsFramework:
     def generate_temple_law_guidance(self, assessment: TempleAssessment) -> str:
         """Generate comprehensive temple law guidance"""
         
-        guidance = "🏛️ TEMPLE LAW GUIDANCE\n"
-        guidance += "Sacred Covenants and Eternal Progression\n"
-        guidance += "=" * 60 + "\n\n"
-        
-        guidance += f"📊 COVENANT FAITHFULNESS: {assessment.covenant_faithfulness_score:.2f}/1.0\n"
-        guidance += f"📈 PROGRESSION SCORE: {assessment.progression_score:.2f}/1.0\n\n"
+        parts = [
+            _GUIDANCE_PREAMBLE,
+            f"📊 COVENANT FAITHFULNESS: {assessment.covenant_faithfulness_score:.2f}/1.0\n",
+            f"📈 PROGRESSION SCORE: {assessment.progression_score:.2f}/1.0\n\n"
+        ]
         
         if assessment.laws_being_lived:
-            guidance += "✅ TEMPLE LAWS BEING LIVED:\n"
-            for law in assessment.laws_being_lived:
-                guidance += f"• {law}\n"
-            guidance += "\n"
+            parts.append("✅ TEMPLE LAWS BEING LIVED:\n")
+            parts.extend(f"• {law}\n" for law in assessment.laws_being_lived)
+            parts.append("\n")
         
         if assessment.areas_for_growth:
-            guidance += "🎯 AREAS FOR GROWTH:\n"
-            for area in assessment.areas_for_growth:
-                guidance += f"• {area}\n"
-            guidance += "\n"
-        
-        guidance += "💡 RECOMMENDATIONS:\n"
-        for rec in assessment.recommendations:
-            guidance += f"• {rec}\n"
-        guidance += "\n"
+            parts.append("🎯 AREAS FOR GROWTH:\n")
+            parts.extend(f"• {area}\n" for area in assessment.areas_for_growth)
+            parts.append("\n")
         
-        guidance += "🌟 ETERNAL PERSPECTIVE:\n"
-        guidance += f"{assessment.eternal_perspective}\n\n"
+        parts.append("💡 RECOMMENDATIONS:\n")
+        parts.extend(f"• {rec}\n" for rec in assessment.recommendations)
+        parts.append("\n")
         
-        guidance += "📖 REMEMBER:\n"
-        guidance += "Temple covenants are the pathway to eternal life and exaltation.\n"
-        guidance += "Through Christ's Atonement, you can become joint-heirs with Him\n"
-        guidance += "and inherit all that the Father has. Stay faithful to your covenants!\n\n"
+        parts.append(f"🌟 ETERNAL PERSPECTIVE:\n{assessment.eternal_perspective}\n\n")
+        parts.append(_REMEMBER_BLOCK)
+        parts.append(_PROMISE_BLOCK)
         
-        guidance += "🕊️ ULTIMATE PROMISE:\n"
-        guidance += "\"Then shall they be gods, because they have no end; therefore shall they be\n"
-        guidance += "from everlasting to everlasting, because they continue\" - D&C 132:20\n"
-        
-        return guidance
+        return "".join(parts)
     
     def get_temple_law_details(self, law_name: str) -> Optional[TempleLaw]:
         """Get detailed information about a specific temple law"""
@@ -408,27 +446,38 @@ class TempleLawsFramework:
     
     def get_all_temple_laws_summary(self) -> str:
         """Get summary of all temple laws"""
-        summary = "🏛️ TEMPLE LAWS FOR ETERNAL PROGRESSION\n"
-        summary += "=" * 55 + "\n\n"
-        
-        summary += "These sacred laws, when lived faithfully, enable progression\n"
-        summary += "toward eternal life and exaltation through Christ's Atonement.\n\n"
-        
-        for i, (key, law) in enumerate(self.temple_laws.items(), 1):
-            summary += f"{i}. {law.law_name.upper()}\n"
-            summary += f"   Description: {law.description}\n"
-            summary += f"   Progression: {law.progression_toward_godhood}\n"
-            summary += f"   Key reference: {law.scripture_references[0]}\n\n"
+        return self.temple_laws_summary
+    
+    def _build_all_laws_summary(self) -> str:
+        """Build the summary of all temple laws"""
+        parts = [
+            "🏛️ TEMPLE LAWS FOR ETERNAL PROGRESSION",
+            "=" * 55,
+            "",
+            "These sacred laws, when lived faithfully, enable progression",
+            "toward eternal life and exaltation through Christ's Atonement.",
+            ""
+        ]
         
-        summary += "🌟 ULTIMATE GOAL:\n"
-        summary += "To become joint-heirs with Christ and inherit all that the Father has\n"
-        summary += "through faithful observance of sacred temple covenants.\n\n"
+        for i, law in enumerate(self.temple_laws.values(), 1):
+            parts.append(f"{i}. {law.law_name.upper()}")
+            parts.append(f"   Description: {law.description}")
+            parts.append(f"   Progression: {law.progression_toward_godhood}")
+            parts.append(f"   Key reference: {law.scripture_references[0]}")
+            parts.append("")
         
-        summary += "💝 ATONEMENT CONNECTION:\n"
-        summary += "All temple laws and ordinances derive their power from Christ's\n"
-        summary += "infinite Atonement, which enables our exaltation and eternal life.\n"
+        parts.extend((
+            "🌟 ULTIMATE GOAL:",
+            "To become joint-heirs with Christ and inherit all that the Father has",
+            "through faithful observance of sacred temple covenants.",
+            "",
+            "💝 ATONEMENT CONNECTION:",
+            "All temple laws and ordinances derive their power from Christ's",
+            "infinite Atonement, which enables our exaltation and eternal life.",
+            ""
+        ))
         
-        return summary
+        return "\n".join(parts)
 
 # Example usage and demonstration
 def demonstrate_temple_laws():
@@ -5,15 +5,19 @@ Based on John 8:32 "And ye shall know the truth, and the truth shall make you fr
 Truth planted in our hearts transforms us and predictively solves problems
 """
 
+from __future__ import annotations
+
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Tuple
+from functools import cached_property, lru_cache
+from typing import AbstractSet, Optional
 from enum import Enum
-import logging
-from .core_truths import TruthStatement, TruthLevel
+import re
+import sys
+from bisect import bisect_right
+from ._keyword_trie import compile_sweep
 from .atonement_supreme import AtonementSupremeTruth
 
-logger = logging.getLogger(__name__)
-
 class TruthInternalizationLevel(Enum):
     """Levels of how deeply truth is planted in us"""
     HEARD = 1          # Truth heard but not yet believed
@@ -32,27 +36,130 @@ class FreedomType(Enum):
     MORAL = "moral"           # Freedom to choose right consistently
     ETERNAL = "eternal"       # Freedom from death and limitation
 
-@dataclass
+# Per-instance bound on memoized solutions and prescriptions
+_PROBLEM_CACHE_SIZE = 1024
+
+# Static sections of the truth prescription report
+_SEPARATOR = "=" * 60
+_FOUNDATIONAL_BLOCK = (
+    "📖 FOUNDATIONAL TRUTH:\n"
+    "The Atonement of Jesus Christ is the supreme truth that enables all freedom.\n"
+    "No problem is too great for His infinite power to solve.\n\n"
+)
+_FOOTER_BLOCK = (
+    "\n💡 REMEMBER: Truth sets us free not just by knowing it, but by living it.\n"
+    "Let these truths be planted deep in your heart until they transform your very nature.\n"
+    "\n'And ye shall know the truth, and the truth shall make you free.' - John 8:32"
+)
+
+# Keyword tables for problem classification, in priority order
+_FREEDOM_KEYWORDS = (
+    (FreedomType.SPIRITUAL, ("guilt", "sin", "shame", "spiritual", "god", "prayer")),
+    (FreedomType.MENTAL, ("confused", "thinking", "beliefs", "understanding", "mind")),
+    (FreedomType.EMOTIONAL, ("anxious", "depressed", "fear", "emotions", "feelings")),
+    (FreedomType.RELATIONAL, ("relationship", "marriage", "family", "friends", "love")),
+    (FreedomType.MORAL, ("temptation", "choices", "moral", "right", "wrong"))
+)
+
+_INTERNALIZATION_KEYWORDS = (
+    # Severe problems need deep transformation
+    (TruthInternalizationLevel.TRANSFORMING, ("suicidal", "addiction", "severe", "desperate", "hopeless")),
+    # Persistent problems need truth to be living in us
+    (TruthInternalizationLevel.LIVING, ("chronic", "ongoing", "always", "constantly", "pattern")),
+    # Heart issues need truth planted
+    (TruthInternalizationLevel.PLANTED, ("heart", "deep", "core", "fundamental", "identity")),
+    # Intellectual struggles need belief
+    (TruthInternalizationLevel.BELIEVED, ("doubt", "question", "uncertain", "confused", "understand"))
+)
+
+# Problems that stretch the transformation timeline
+_SEVERITY_KEYWORDS = ("severe", "chronic", "addiction", "trauma")
+
+# Markers of freedom that apply to every problem
+_UNIVERSAL_MARKERS = (
+    "Increased desire to study scriptures and pray",
+    "Greater ability to help others with similar problems",
+    "Growing testimony of Christ's power to save"
+)
+
+# Precomputed display text for enum members
+_FREEDOM_TITLE = {freedom_type: freedom_type.value.title() for freedom_type in FreedomType}
+_FREEDOM_MARKER = {freedom_type: f"Evidence of {freedom_type.value} freedom" for freedom_type in FreedomType}
+_INTERNALIZATION_NAME = {level: level.name for level in TruthInternalizationLevel}
+
+# Integer codes for enum members used on the classification hot path:
+# a freedom code indexes _FREEDOM_FROM_INT, a level code is value - 1
+_FREEDOM_FROM_INT = tuple(FreedomType)
+_LEVEL_FROM_INT = tuple(TruthInternalizationLevel)
+_FREEDOM_CODE_KEYWORDS = tuple(
+    (_FREEDOM_FROM_INT.index(freedom_type), keywords) for freedom_type, keywords in _FREEDOM_KEYWORDS
+)
+_LEVEL_CODE_KEYWORDS = tuple(
+    (level.value - 1, keywords) for level, keywords in _INTERNALIZATION_KEYWORDS
+)
+_ETERNAL_CODE = _FREEDOM_FROM_INT.index(FreedomType.ETERNAL)
+_UNDERSTOOD_CODE = TruthInternalizationLevel.UNDERSTOOD.value - 1
+
+# Transformation timeline by internalization level code
+_TIMELINES = (
+    "Days to weeks - initial exposure to truth",         # HEARD
+    "Weeks to months - intellectual grasp develops",     # UNDERSTOOD
+    "Months - faith and trust grow",                     # BELIEVED
+    "Months to years - truth takes root in heart",       # PLANTED
+    "Years - truth governs daily life",                  # LIVING
+    "Years to lifetime - ongoing transformation"         # TRANSFORMING
+)
+
+# Every keyword that influences classification (as opposed to seed matching)
+_CLASSIFIER_VOCABULARY = frozenset(
+    [word for _, keywords in _FREEDOM_KEYWORDS + _INTERNALIZATION_KEYWORDS for word in keywords]
+    + list(_SEVERITY_KEYWORDS)
+)
+
+@lru_cache(maxsize=256)
+def _classify(hits: frozenset[str]) -> tuple[int, int, bool]:
+    """Classify a problem into (freedom code, internalization level code, severity)
+    
+    Takes only the classification keywords found in the problem, so distinct
+    problems with the same category hits share one cache entry.
+    """
+    freedom_code = _ETERNAL_CODE  # Default to eternal perspective
+    for code, keywords in _FREEDOM_CODE_KEYWORDS:
+        if not hits.isdisjoint(keywords):
+            freedom_code = code
+            break
+    
+    # Simple problems may only need understanding
+    level_code = _UNDERSTOOD_CODE
+    for code, keywords in _LEVEL_CODE_KEYWORDS:
+        if not hits.isdisjoint(keywords):
+            level_code = code
+            break
+    
+    return freedom_code, level_code, not hits.isdisjoint(_SEVERITY_KEYWORDS)
+
+@dataclass(slots=True, frozen=True)
 class TruthSeed:
     """A truth that can be planted and grow within us"""
     truth_statement: str
     scripture_source: str
-    freedom_promises: List[str]
-    internalization_stages: List[str]
-    growth_indicators: List[str]
-    problems_it_solves: List[str]
-    transformation_outcomes: List[str]
+    freedom_promises: tuple[str, ...]
+    internalization_stages: tuple[str, ...]
+    growth_indicators: tuple[str, ...]
+    problems_it_solves: tuple[str, ...]
+    transformation_outcomes: tuple[str, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProblemSolution:
     """How truth predictively solves specific problems"""
     problem_description: str
-    relevant_truths: List[TruthSeed]
+    relevant_truths: tuple[TruthSeed, ...]
+    top_relevant_truths: tuple[TruthSeed, ...]  # The first two, as shown in prescriptions
     internalization_needed: TruthInternalizationLevel
     freedom_type: FreedomType
-    predicted_solution_path: List[str]
+    predicted_solution_path: tuple[str, ...]
     transformation_timeline: str
-    verification_markers: List[str]
+    verification_markers: tuple[str, ...]
 
 class TruthInUsSystem:
     """
@@ -60,278 +167,367 @@ class TruthInUsSystem:
     and predicting solutions to problems through internalized truth
     """
     
+    # Read-only tables shared by every instance, built on first construction
+    _TRUTH_SEEDS: Optional[tuple[TruthSeed, ...]] = None
+    _SEED_MASKS: Optional[dict[str, int]] = None
+    _KEYWORD_MATCHER: Optional[tuple[re.Pattern[str], dict[str, frozenset[str]]]] = None
+    _FREEDOM_PATTERNS: Optional[dict[FreedomType, tuple[str, ...]]] = None
+    
     def __init__(self):
-        self.atonement_supreme = AtonementSupremeTruth()
-        self.truth_seeds = self._initialize_truth_seeds()
-        self.freedom_patterns = self._initialize_freedom_patterns()
-        
-    def _initialize_truth_seeds(self) -> List[TruthSeed]:
+        cls = type(self)
+        if cls._TRUTH_SEEDS is None:
+            cls._build_shared_tables()
+        self.truth_seeds = cls._TRUTH_SEEDS
+        self._seed_masks = cls._SEED_MASKS
+        self._keyword_pattern, self._keyword_prefixes = cls._KEYWORD_MATCHER
+        
+        # Solutions and prescriptions depend only on the problem text. Plain LRU
+        # dicts rather than lru_cache-wrapped bound methods, which would hold a
+        # reference back to the system and keep it alive until a gc cycle pass
+        self._solution_cache: OrderedDict[str, ProblemSolution] = OrderedDict()
+        self._prescription_cache: OrderedDict[str, str] = OrderedDict()
+        
+    @cached_property
+    def atonement_supreme(self) -> AtonementSupremeTruth:
+        """Supreme Atonement truth, created on first use"""
+        return AtonementSupremeTruth()
+    
+    @cached_property
+    def freedom_patterns(self) -> dict[FreedomType, tuple[str, ...]]:
+        """Patterns of how truth sets us free, built on first use and shared"""
+        cls = type(self)
+        if cls._FREEDOM_PATTERNS is None:
+            cls._FREEDOM_PATTERNS = cls._initialize_freedom_patterns()
+        return cls._FREEDOM_PATTERNS
+    
+    @classmethod
+    def _build_shared_tables(cls) -> None:
+        """Build the truth seeds and keyword matcher shared by all instances"""
+        truth_seeds = cls._initialize_truth_seeds()
+        seed_masks = cls._initialize_keyword_index(truth_seeds)
+        cls._KEYWORD_MATCHER = cls._initialize_keyword_matcher(seed_masks)
+        cls._SEED_MASKS = seed_masks
+        cls._TRUTH_SEEDS = truth_seeds
+    
+    @staticmethod
+    def _initialize_truth_seeds() -> tuple[TruthSeed, ...]:
         """Initialize truth seeds that can be planted in hearts"""
-        return [
+        return (
             TruthSeed(
                 truth_statement="I am a child of God with infinite worth",
                 scripture_source="Psalm 82:6, Romans 8:16-17, D&C 76:24",
-                freedom_promises=[
+                freedom_promises=(
                     "Freedom from worthlessness and despair",
                     "Freedom from needing others' approval for value",
                     "Freedom to see others as family",
                     "Freedom from comparing yourself to others"
-                ],
-                internalization_stages=[
+                ),
+                internalization_stages=(
                     "Hearing about divine parentage",
                     "Understanding what it means to be God's child",
                     "Believing you are truly His child",
                     "Feeling this truth in your heart",
                     "Living with divine confidence",
                     "Helping others discover their divine nature"
-                ],
-                growth_indicators=[
+                ),
+                growth_indicators=(
                     "Increased self-respect and dignity",
                     "Reduced need for external validation",
                     "Greater compassion for others",
                     "Confidence in facing challenges",
                     "Peace about your eternal worth"
-                ],
-                problems_it_solves=[
+                ),
+                problems_it_solves=(
                     "Low self-esteem and self-worth issues",
                     "Depression from feeling worthless",
                     "Anxiety about acceptance and belonging",
                     "Jealousy and comparison with others",
                     "Fear of rejection or abandonment"
-                ],
-                transformation_outcomes=[
+                ),
+                transformation_outcomes=(
                     "Unshakeable sense of identity and worth",
                     "Ability to love unconditionally",
                     "Freedom from the opinions of others",
                     "Peace in all circumstances"
-                ]
+                )
             ),
             
             TruthSeed(
                 truth_statement="God loves me unconditionally",
                 scripture_source="Romans 8:38-39, 1 John 4:16, Jeremiah 31:3",
-                freedom_promises=[
+                freedom_promises=(
                     "Freedom from fear of God's rejection",
                     "Freedom from earning love through performance",
                     "Freedom to approach God with confidence",
                     "Freedom from shame and condemnation"
-                ],
-                internalization_stages=[
+                ),
+                internalization_stages=(
                     "Learning about God's love conceptually",
                     "Understanding love is not performance-based",
                     "Believing God truly loves you personally",
                     "Feeling His love in your heart",
                     "Living in that love daily",
                     "Sharing that love with others"
-                ],
-                growth_indicators=[
+                ),
+                growth_indicators=(
                     "Reduced fear in prayer and worship",
                     "Less anxiety about making mistakes",
                     "Increased boldness in spiritual growth",
                     "Greater capacity to love others",
                     "Peace during trials and difficulties"
-                ],
-                problems_it_solves=[
+                ),
+                problems_it_solves=(
                     "Religious anxiety and fear of God",
                     "Perfectionism and performance pressure",
                     "Shame from past mistakes",
                     "Fear of divine punishment",
                     "Inability to accept forgiveness"
-                ],
-                transformation_outcomes=[
+                ),
+                transformation_outcomes=(
                     "Intimate relationship with God",
                     "Confidence in approaching the throne of grace",
                     "Ability to rest in divine love",
                     "Freedom to be authentic before God"
-                ]
+                )
             ),
             
             TruthSeed(
                 truth_statement="Christ's Atonement covers all my sins and pains",
                 scripture_source="1 John 1:9, Alma 7:11-12, Isaiah 53:4-5",
-                freedom_promises=[
+                freedom_promises=(
                     "Freedom from guilt and condemnation",
                     "Freedom from the burden of past mistakes",
                     "Freedom from pain and suffering's ultimate power",
                     "Freedom to start fresh at any moment"
-                ],
-                internalization_stages=[
+                ),
+                internalization_stages=(
                     "Learning about the Atonement doctrinally",
                     "Understanding it applies to you personally",
                     "Believing Christ paid for your specific sins",
                     "Feeling the peace of forgiveness",
                     "Living without guilt and shame",
                     "Helping others find this same freedom"
-                ],
-                growth_indicators=[
+                ),
+                growth_indicators=(
                     "Reduced guilt and self-condemnation",
                     "Increased hope during difficulties",
                     "Greater willingness to repent quickly",
                     "Peace about past mistakes",
                     "Confidence in God's mercy"
-                ],
-                problems_it_solves=[
+                ),
+                problems_it_solves=(
                     "Overwhelming guilt from past sins",
                     "Despair over repeated failures",
                     "Fear of divine punishment",
                     "Inability to forgive yourself",
                     "Hopelessness about spiritual progress"
-                ],
-                transformation_outcomes=[
+                ),
+                transformation_outcomes=(
                     "Complete freedom from guilt and shame",
                     "Rapid repentance and course correction",
                     "Unshakeable hope in God's mercy",
                     "Ability to help others find forgiveness"
-                ]
+                )
             ),
             
             TruthSeed(
                 truth_statement="All things work together for my good",
                 scripture_source="Romans 8:28, D&C 90:24, 2 Nephi 2:2",
-                freedom_promises=[
+                freedom_promises=(
                     "Freedom from despair during trials",
                     "Freedom from fear of the future",
                     "Freedom from feeling like a victim",
                     "Freedom to find meaning in suffering"
-                ],
-                internalization_stages=[
+                ),
+                internalization_stages=(
                     "Learning this promise from scripture",
                     "Understanding God's sovereignty and love",
                     "Believing this applies to your trials",
                     "Seeing God's hand in difficult times",
                     "Living with trust during adversity",
                     "Testifying of God's goodness to others"
-                ],
-                growth_indicators=[
+                ),
+                growth_indicators=(
                     "Reduced anxiety about future problems",
                     "Ability to find good in difficult situations",
                     "Increased faith during trials",
                     "Peace even when circumstances are hard",
                     "Gratitude for growth through challenges"
-                ],
-                problems_it_solves=[
+                ),
+                problems_it_solves=(
                     "Despair and hopelessness during trials",
                     "Anxiety about uncontrollable circumstances",
                     "Bitterness toward God for allowing suffering",
                     "Feeling like life is meaningless",
                     "Fear of future difficulties"
-                ],
-                transformation_outcomes=[
+                ),
+                transformation_outcomes=(
                     "Unshakeable peace during any trial",
                     "Ability to comfort others in their trials",
                     "Deep trust in God's timing and purposes",
                     "Joy even in the midst of suffering"
-                ]
+                )
             ),
             
             TruthSeed(
                 truth_statement="I can do all things through Christ who strengthens me",
                 scripture_source="Philippians 4:13, Ether 12:27, D&C 4:7",
-                freedom_promises=[
+                freedom_promises=(
                     "Freedom from limitations and impossibility thinking",
                     "Freedom from fear of inadequacy",
                     "Freedom from giving up too early",
                     "Freedom to attempt great things for God"
-                ],
-                internalization_stages=[
+                ),
+                internalization_stages=(
                     "Learning about divine enabling power",
                     "Understanding grace strengthens us",
                     "Believing Christ will help you specifically",
                     "Experiencing His strength in weakness",
                     "Living with divine confidence",
                     "Encouraging others to attempt great things"
-                ],
-                growth_indicators=[
+                ),
+                growth_indicators=(
                     "Increased willingness to take on challenges",
                     "Reduced fear of failure",
                     "Greater persistence in difficult tasks",
                     "Recognition of divine help in achievements",
                     "Boldness in serving God and others"
-                ],
-                problems_it_solves=[
+                ),
+                problems_it_solves=(
                     "Feeling overwhelmed by life's demands",
                     "Fear of taking on new challenges",
                     "Giving up when things get difficult",
                     "Believing you're not capable enough",
                     "Paralysis from perfectionism"
-                ],
-                transformation_outcomes=[
+                ),
+                transformation_outcomes=(
                     "Confident approach to any challenge",
                     "Persistence through all obstacles",
                     "Recognition that weakness becomes strength",
                     "Ability to accomplish the impossible through Christ"
-                ]
+                )
             )
-        ]
+        )
     
-    def _initialize_freedom_patterns(self) -> Dict[FreedomType, List[str]]:
+    @staticmethod
+    def _initialize_freedom_patterns() -> dict[FreedomType, tuple[str, ...]]:
         """Initialize patterns of how truth sets us free in different areas"""
         return {
-            FreedomType.SPIRITUAL: [
+            FreedomType.SPIRITUAL: (
                 "Truth breaks chains of sin and addiction",
                 "Truth removes guilt and condemnation",
                 "Truth opens communication with God",
                 "Truth enables spiritual growth and progression"
-            ],
-            FreedomType.MENTAL: [
+            ),
+            FreedomType.MENTAL: (
                 "Truth replaces lies with reality",
                 "Truth brings clarity to confusion",
                 "Truth stops destructive thought patterns",
                 "Truth enables right thinking and wisdom"
-            ],
-            FreedomType.EMOTIONAL: [
+            ),
+            FreedomType.EMOTIONAL: (
                 "Truth calms anxiety and fear",
                 "Truth heals emotional wounds",
                 "Truth brings peace to troubled hearts",
                 "Truth enables healthy emotional processing"
-            ],
-            FreedomType.RELATIONAL: [
+            ),
+            FreedomType.RELATIONAL: (
                 "Truth enables authentic relationships",
                 "Truth breaks down walls of mistrust",
                 "Truth teaches how to love unconditionally",
                 "Truth heals relationship wounds"
-            ],
-            FreedomType.MORAL: [
+            ),
+            FreedomType.MORAL: (
                 "Truth empowers right choices",
                 "Truth strengthens resistance to temptation",
                 "Truth clarifies moral standards",
                 "Truth enables consistent righteousness"
-            ],
-            FreedomType.ETERNAL: [
+            ),
+            FreedomType.ETERNAL: (
                 "Truth provides hope beyond death",
                 "Truth reveals eternal purposes",
                 "Truth connects us to eternal progression",
                 "Truth prepares us for celestial glory"
-            ]
+            )
         }
     
-    def predict_truth_solution(self, problem_description: str, current_beliefs: List[str] = None) -> ProblemSolution:
+    @staticmethod
+    def _initialize_keyword_index(truth_seeds: tuple[TruthSeed, ...]) -> dict[str, int]:
+        """Map each problem keyword to the bitmask of seeds that use it"""
+        seed_masks: dict[str, int] = {}
+        for seed_index, seed in enumerate(truth_seeds):
+            for keyword in " ".join(seed.problems_it_solves).lower().split():
+                # Keywords come from split(), so intern them to share one copy per word
+                keyword = sys.intern(keyword)
+                seed_masks[keyword] = seed_masks.get(keyword, 0) | (1 << seed_index)
+        return seed_masks
+    
+    @staticmethod
+    def _initialize_keyword_matcher(seed_masks: dict[str, int]) -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+        """Compile every seed and classification keyword into one sweep pattern
+        
+        The pattern reports the longest keyword starting at each position of
+        the text; the returned map expands it to every keyword that is a prefix
+        of it, so one sweep finds all keywords occurring as substrings.
+        """
+        vocabulary = set(seed_masks)
+        for _, keywords in _FREEDOM_KEYWORDS + _INTERNALIZATION_KEYWORDS:
+            vocabulary.update(keywords)
+        vocabulary.update(_SEVERITY_KEYWORDS)
+        return compile_sweep(vocabulary)
+    
+    def _match_keywords(self, problem_lower: str) -> AbstractSet[str]:
+        """Return every known keyword that occurs in the lowercased problem"""
+        hits = set()
+        for keyword in self._keyword_pattern.findall(problem_lower):
+            hits |= self._keyword_prefixes[keyword]
+        return hits
+    
+    def predict_truth_solution(self, problem_description: str, current_beliefs: Optional[list[str]] = None) -> ProblemSolution:
         """Predict how truth can set someone free from a specific problem"""
-        if current_beliefs is None:
-            current_beliefs = []
-        
+        cached = self._solution_cache.get(problem_description)
+        if cached is not None:
+            self._solution_cache.move_to_end(problem_description)
+            return cached
+        
+        solution = self._solve_problem(problem_description)
+        self._solution_cache[problem_description] = solution
+        if len(self._solution_cache) > _PROBLEM_CACHE_SIZE:
+            self._solution_cache.popitem(last=False)
+        return solution
+    
+    def _solve_problem(self, problem_description: str) -> ProblemSolution:
+        """Build the truth solution for a problem (memoized per instance)"""
+        # Sweep the problem once for every seed and classification keyword
+        hits = self._match_keywords(problem_description.lower())
+        return self._solution_from_hits(problem_description, hits)
+    
+    def _solution_from_hits(self, problem_description: str, hits: AbstractSet[str]) -> ProblemSolution:
+        """Build the truth solution for a problem from its keyword hits"""
         # Find relevant truth seeds for this problem
-        relevant_truths = []
-        for seed in self.truth_seeds:
-            if any(keyword in problem_description.lower() for keyword in 
-                   " ".join(seed.problems_it_solves).lower().split()):
-                relevant_truths.append(seed)
+        all_seeds = (1 << len(self.truth_seeds)) - 1
+        matched = 0
+        for keyword in hits:
+            matched |= self._seed_masks.get(keyword, 0)
+            if matched == all_seeds:
+                break
+        relevant_truths = tuple(
+            seed for i, seed in enumerate(self.truth_seeds) if matched >> i & 1
+        )
         
         if not relevant_truths:
             # Default to core identity truth if no specific match
-            relevant_truths = [self.truth_seeds[0]]  # "I am a child of God"
-        
-        # Determine freedom type needed
-        freedom_type = self._determine_freedom_type(problem_description)
+            relevant_truths = (self.truth_seeds[0],)  # "I am a child of God"
         
-        # Determine internalization level needed
-        internalization_needed = self._determine_internalization_needed(problem_description)
+        # Determine freedom type, internalization level and severity
+        freedom_code, level_code, severe = _classify(_CLASSIFIER_VOCABULARY.intersection(hits))
+        freedom_type = _FREEDOM_FROM_INT[freedom_code]
         
         # Generate solution path
-        solution_path = self._generate_solution_path(relevant_truths, freedom_type, internalization_needed)
+        solution_path = self._generate_solution_path(relevant_truths, freedom_type, level_code)
         
         # Create timeline
-        timeline = self._estimate_transformation_timeline(internalization_needed, problem_description)
+        timeline = self._estimate_transformation_timeline(level_code, severe)
         
         # Generate verification markers
         verification_markers = self._generate_verification_markers(relevant_truths, freedom_type)
@@ -339,56 +535,16 @@ class TruthInUsSystem:
         return ProblemSolution(
             problem_description=problem_description,
             relevant_truths=relevant_truths,
-            internalization_needed=internalization_needed,
+            top_relevant_truths=relevant_truths[:2],
+            internalization_needed=_LEVEL_FROM_INT[level_code],
             freedom_type=freedom_type,
-            predicted_solution_path=solution_path,
+            predicted_solution_path=tuple(solution_path),
             transformation_timeline=timeline,
             verification_markers=verification_markers
         )
     
-    def _determine_freedom_type(self, problem: str) -> FreedomType:
-        """Determine what type of freedom is needed for this problem"""
-        problem_lower = problem.lower()
-        
-        if any(word in problem_lower for word in ["guilt", "sin", "shame", "spiritual", "god", "prayer"]):
-            return FreedomType.SPIRITUAL
-        elif any(word in problem_lower for word in ["confused", "thinking", "beliefs", "understanding", "mind"]):
-            return FreedomType.MENTAL
-        elif any(word in problem_lower for word in ["anxious", "depressed", "fear", "emotions", "feelings"]):
-            return FreedomType.EMOTIONAL
-        elif any(word in problem_lower for word in ["relationship", "marriage", "family", "friends", "love"]):
-            return FreedomType.RELATIONAL
-        elif any(word in problem_lower for word in ["temptation", "choices", "moral", "right", "wrong"]):
-            return FreedomType.MORAL
-        else:
-            return FreedomType.ETERNAL  # Default to eternal perspective
-    
-    def _determine_internalization_needed(self, problem: str) -> TruthInternalizationLevel:
-        """Determine how deeply truth needs to be internalized for this problem"""
-        problem_lower = problem.lower()
-        
-        # Severe problems need deep transformation
-        if any(word in problem_lower for word in ["suicidal", "addiction", "severe", "desperate", "hopeless"]):
-            return TruthInternalizationLevel.TRANSFORMING
-        
-        # Persistent problems need truth to be living in us
-        elif any(word in problem_lower for word in ["chronic", "ongoing", "always", "constantly", "pattern"]):
-            return TruthInternalizationLevel.LIVING
-        
-        # Heart issues need truth planted
-        elif any(word in problem_lower for word in ["heart", "deep", "core", "fundamental", "identity"]):
-            return TruthInternalizationLevel.PLANTED
-        
-        # Intellectual struggles need belief
-        elif any(word in problem_lower for word in ["doubt", "question", "uncertain", "confused", "understand"]):
-            return TruthInternalizationLevel.BELIEVED
-        
-        # Simple problems may only need understanding
-        else:
-            return TruthInternalizationLevel.UNDERSTOOD
-    
-    def _generate_solution_path(self, truths: List[TruthSeed], freedom_type: FreedomType, 
-                               internalization_level: TruthInternalizationLevel) -> List[str]:
+    def _generate_solution_path(self, truths: tuple[TruthSeed, ...], freedom_type: FreedomType, 
+                               level_index: int) -> list[str]:
         """Generate specific steps for truth to set someone free"""
         if not truths:
             return ["Seek divine truth through prayer and scripture study"]
@@ -400,7 +556,6 @@ class TruthInUsSystem:
         path.append("Ground all truth in Christ's Atonement as the supreme foundation")
         
         # Add truth-specific steps based on internalization level needed
-        level_index = internalization_level.value - 1
         if level_index < len(primary_truth.internalization_stages):
             path.append(f"Focus on: {primary_truth.internalization_stages[level_index]}")
         
@@ -416,95 +571,109 @@ class TruthInUsSystem:
         
         return path
     
-    def _estimate_transformation_timeline(self, level: TruthInternalizationLevel, problem: str) -> str:
+    def _estimate_transformation_timeline(self, level_index: int, severe: bool) -> str:
         """Estimate how long transformation might take"""
-        timelines = {
-            TruthInternalizationLevel.HEARD: "Days to weeks - initial exposure to truth",
-            TruthInternalizationLevel.UNDERSTOOD: "Weeks to months - intellectual grasp develops",
-            TruthInternalizationLevel.BELIEVED: "Months - faith and trust grow",
-            TruthInternalizationLevel.PLANTED: "Months to years - truth takes root in heart",
-            TruthInternalizationLevel.LIVING: "Years - truth governs daily life",
-            TruthInternalizationLevel.TRANSFORMING: "Years to lifetime - ongoing transformation"
-        }
-        
-        base_timeline = timelines.get(level, "Variable timeline")
+        base_timeline = _TIMELINES[level_index]
         
         # Adjust for problem severity
-        if any(word in problem.lower() for word in ["severe", "chronic", "addiction", "trauma"]):
+        if severe:
             return f"{base_timeline} (Note: Severe problems may require additional time and support)"
         
         return base_timeline
     
-    def _generate_verification_markers(self, truths: List[TruthSeed], freedom_type: FreedomType) -> List[str]:
-        """Generate markers to verify truth is setting someone free"""
+    def _generate_verification_markers(self, truths: tuple[TruthSeed, ...], freedom_type: FreedomType) -> tuple[str, ...]:
+        """Generate markers to verify truth is setting someone free (at most 5)"""
         if not truths:
-            return ["Increased peace and hope", "Better decision making", "Growing faith"]
-        
-        markers = []
+            return ("Increased peace and hope", "Better decision making", "Growing faith")
         
         # Add truth-specific markers
-        primary_truth = truths[0]
-        if primary_truth.growth_indicators:
-            markers.extend(primary_truth.growth_indicators[:3])
+        markers = list(truths[0].growth_indicators[:3])
         
         # Add freedom-specific markers
-        freedom_patterns = self.freedom_patterns.get(freedom_type, [])
-        if freedom_patterns:
-            markers.append(f"Evidence of {freedom_type.value} freedom")
+        if self.freedom_patterns.get(freedom_type):
+            markers.append(_FREEDOM_MARKER[freedom_type])
         
-        # Add universal markers
-        markers.extend([
-            "Increased desire to study scriptures and pray",
-            "Greater ability to help others with similar problems",
-            "Growing testimony of Christ's power to save"
-        ])
+        # Fill the remaining slots with universal markers
+        markers.extend(_UNIVERSAL_MARKERS[:5 - len(markers)])
         
-        return markers[:5]  # Limit to top 5 markers
+        return tuple(markers)
     
     def generate_truth_prescription(self, problem: str) -> str:
         """Generate a complete 'prescription' of truth for a problem"""
-        solution = self.predict_truth_solution(problem)
-        
-        prescription = f"🌱 TRUTH PRESCRIPTION FOR: {problem}\n"
-        prescription += "=" * 60 + "\n\n"
+        cached = self._prescription_cache.get(problem)
+        if cached is not None:
+            self._prescription_cache.move_to_end(problem)
+            return cached
+        
+        prescription = self._build_prescription(problem)
+        self._prescription_cache[problem] = prescription
+        if len(self._prescription_cache) > _PROBLEM_CACHE_SIZE:
+            self._prescription_cache.popitem(last=False)
+        return prescription
+    
+    def generate_prescriptions(self, problems: list[str]) -> list[str]:
+        """Generate truth prescriptions for a batch of problems with one keyword sweep"""
+        lowered = [problem.lower() for problem in problems]
+        starts = []
+        offset = 0
+        for problem_lower in lowered:
+            starts.append(offset)
+            offset += len(problem_lower) + 1
+        
+        # No keyword contains a newline, so no match can span two problems
+        hit_sets = [set() for _ in problems]
+        for match in self._keyword_pattern.finditer("\n".join(lowered)):
+            hit_sets[bisect_right(starts, match.start()) - 1] |= self._keyword_prefixes[match.group(1)]
         
-        prescription += "📖 FOUNDATIONAL TRUTH:\n"
-        prescription += "The Atonement of Jesus Christ is the supreme truth that enables all freedom.\n"
-        prescription += "No problem is too great for His infinite power to solve.\n\n"
+        return [
+            self._render_prescription(self._solution_from_hits(problem, hits))
+            for problem, hits in zip(problems, hit_sets)
+        ]
+    
+    def _build_prescription(self, problem: str) -> str:
+        """Render the truth prescription for a problem (memoized per instance)"""
+        return self._render_prescription(self.predict_truth_solution(problem))
+    
+    def _render_prescription(self, solution: ProblemSolution) -> str:
+        """Render the truth prescription for a solved problem"""
+        parts = [
+            f"🌱 TRUTH PRESCRIPTION FOR: {solution.problem_description}\n{_SEPARATOR}\n\n",
+            _FOUNDATIONAL_BLOCK
+        ]
         
-        if solution.relevant_truths:
-            prescription += "🌱 TRUTH SEEDS TO PLANT IN YOUR HEART:\n"
-            for i, truth in enumerate(solution.relevant_truths[:2], 1):
-                prescription += f"{i}. {truth.truth_statement}\n"
-                prescription += f"   Scripture: {truth.scripture_source}\n"
-                prescription += f"   Promise: {truth.freedom_promises[0] if truth.freedom_promises else 'Freedom and peace'}\n\n"
+        if solution.top_relevant_truths:
+            parts.append("🌱 TRUTH SEEDS TO PLANT IN YOUR HEART:\n")
+            for i, truth in enumerate(solution.top_relevant_truths, 1):
+                parts.append(f"{i}. {truth.truth_statement}\n")
+                parts.append(f"   Scripture: {truth.scripture_source}\n")
+                parts.append(f"   Promise: {truth.freedom_promises[0] if truth.freedom_promises else 'Freedom and peace'}\n\n")
         
-        prescription += f"🎯 INTERNALIZATION GOAL: {solution.internalization_needed.name}\n"
-        prescription += f"🔓 FREEDOM TYPE: {solution.freedom_type.value.title()}\n"
-        prescription += f"⏰ TIMELINE: {solution.transformation_timeline}\n\n"
+        parts.append(f"🎯 INTERNALIZATION GOAL: {_INTERNALIZATION_NAME[solution.internalization_needed]}\n")
+        parts.append(f"🔓 FREEDOM TYPE: {_FREEDOM_TITLE[solution.freedom_type]}\n")
+        parts.append(f"⏰ TIMELINE: {solution.transformation_timeline}\n\n")
         
-        prescription += "📋 SOLUTION PATH:\n"
+        parts.append("📋 SOLUTION PATH:\n")
         for i, step in enumerate(solution.predicted_solution_path, 1):
-            prescription += f"{i}. {step}\n"
+            parts.append(f"{i}. {step}\n")
         
-        prescription += "\n✅ FREEDOM MARKERS TO WATCH FOR:\n"
+        parts.append("\n✅ FREEDOM MARKERS TO WATCH FOR:\n")
         for marker in solution.verification_markers:
-            prescription += f"• {marker}\n"
+            parts.append(f"• {marker}\n")
         
-        prescription += "\n💡 REMEMBER: Truth sets us free not just by knowing it, but by living it.\n"
-        prescription += "Let these truths be planted deep in your heart until they transform your very nature.\n"
-        prescription += "\n'And ye shall know the truth, and the truth shall make you free.' - John 8:32"
+        parts.append(_FOOTER_BLOCK)
         
-        return prescription
+        return "".join(parts)
 
 # Example usage and integration
 def demonstrate_truth_in_us_system():
     """Demonstrate how truth living in us predictively sets us free"""
     system = TruthInUsSystem()
     
-    print("🌱 TRUTH IN US - SETTING US FREE SYSTEM")
-    print("=" * 60)
-    print("Based on John 8:32: 'And ye shall know the truth, and the truth shall make you free'\n")
+    buf = [
+        "🌱 TRUTH IN US - SETTING US FREE SYSTEM\n",
+        f"{_SEPARATOR}\n",
+        "Based on John 8:32: 'And ye shall know the truth, and the truth shall make you free'\n\n"
+    ]
     
     # Example problems
     example_problems = [
@@ -514,13 +683,12 @@ def demonstrate_truth_in_us_system():
         "I don't think I'm capable of overcoming my challenges"
     ]
     
-    for problem in example_problems:
-        print(f"🔍 PROBLEM: {problem}")
-        print("-" * 40)
-        
-        prescription = system.generate_truth_prescription(problem)
-        print(prescription)
-        print("\n" + "=" * 60 + "\n")
+    prescriptions = system.generate_prescriptions(example_problems)
+    for problem, prescription in zip(example_problems, prescriptions):
+        buf.append(f"🔍 PROBLEM: {problem}\n{'-' * 40}\n{prescription}\n\n{_SEPARATOR}\n\n")
+    
+    # One write for the whole report instead of a print per line
+    sys.stdout.write("".join(buf))
 
 if __name__ == "__main__":
     demonstrate_truth_in_us_system()
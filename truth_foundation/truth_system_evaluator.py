@@ -5,13 +5,28 @@ Based on patterns like Russell Nelson's heart analogy and D&C 121:39-45
 Evaluates what truth laws are in place and how they're being applied
 """
 
+from bisect import bisect_right
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import AbstractSet, FrozenSet, List, Mapping, Any, Pattern, Tuple
 from enum import Enum
 import logging
+import re
+from operator import attrgetter
+from ._keyword_trie import compile_sweep
 
 logger = logging.getLogger(__name__)
 
+# Score accessor for C-level aggregation over principle lists
+_UNIVERSALITY_SCORE = attrgetter("universality_score")
+
+# Per-evaluator bound on memoized evaluations
+_EVALUATION_CACHE_SIZE = 128
+
+# Words marking a principle as universal/eternal
+_UNIVERSAL_INDICATORS = ("love", "truth", "justice", "mercy", "honesty", "service")
+
 class TruthLaw(Enum):
     """Categories of truth laws that govern systems"""
     DIVINE_LAW = "divine_law"           # Eternal, unchanging principles from God
@@ -31,33 +46,270 @@ class TruthSystemType(Enum):
     PERSONAL = "personal"
     ORGANIZATIONAL = "organizational"
 
-@dataclass
+# Lookups keyed by law type cover every TruthLaw member, so they are indexed directly
+
+# Where each law type draws its authority from
+_SOURCE_AUTHORITIES: Mapping[TruthLaw, str] = MappingProxyType({
+    TruthLaw.DIVINE_LAW: "Scripture and revelation",
+    TruthLaw.NATURAL_LAW: "Observation and scientific method",
+    TruthLaw.MORAL_LAW: "Universal moral intuition and reasoning",
+    TruthLaw.SPIRITUAL_LAW: "Spiritual experience and religious teaching",
+    TruthLaw.SOCIAL_LAW: "Social contract and cultural agreement",
+    TruthLaw.LOGICAL_LAW: "Rational thought and philosophical reasoning"
+})
+
+# How each law type can be verified
+_VERIFICATION_METHODS: Mapping[TruthLaw, str] = MappingProxyType({
+    TruthLaw.DIVINE_LAW: "Spiritual confirmation and scriptural consistency",
+    TruthLaw.NATURAL_LAW: "Scientific experiment and observation",
+    TruthLaw.MORAL_LAW: "Practical outcomes and universal consensus",
+    TruthLaw.SPIRITUAL_LAW: "Personal experience and spiritual fruits",
+    TruthLaw.SOCIAL_LAW: "Social outcomes and collective agreement",
+    TruthLaw.LOGICAL_LAW: "Logical consistency and rational analysis"
+})
+
+# Display titles used when a law type is reported missing
+_LAW_TITLES: Mapping[TruthLaw, str] = MappingProxyType({
+    law_type: law_type.value.replace('_', ' ').title() for law_type in TruthLaw
+})
+
+@dataclass(slots=True, frozen=True)
 class TruthPrinciple:
     """A specific principle or law within a truth system"""
     name: str
     law_type: TruthLaw
     statement: str
-    source_authority: str
-    evidence_supporting: List[str]
-    contradictions_noted: List[str]
-    practical_applications: List[str]
-    verification_method: str
+    evidence_supporting: Tuple[str, ...]
+    contradictions_noted: Tuple[str, ...]
+    practical_applications: Tuple[str, ...]
     universality_score: float  # 0.0 to 1.0
     consistency_score: float   # 0.0 to 1.0
+    
+    @property
+    def source_authority(self) -> str:
+        """The source of authority for this principle, by law type"""
+        return _SOURCE_AUTHORITIES[self.law_type]
+    
+    @property
+    def verification_method(self) -> str:
+        """How this type of law can be verified"""
+        return _VERIFICATION_METHODS[self.law_type]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemEvaluation:
     """Comprehensive evaluation of a truth system"""
     system_name: str
     system_type: TruthSystemType
-    active_principles: List[TruthPrinciple]
+    active_principles: Tuple[TruthPrinciple, ...]
     truth_foundation: str
-    consistency_analysis: Dict[str, Any]
-    gaps_identified: List[str]
-    contradictions_found: List[str]
+    consistency_analysis: Mapping[str, Any]
+    gaps_identified: Tuple[str, ...]
+    contradictions_found: Tuple[str, ...]
     truth_utilization_score: float
     recommendation: str
 
+@dataclass(frozen=True)
+class _PrincipleRecord:
+    """A known principle with its matching keywords precomputed"""
+    statement: str
+    law_type: TruthLaw
+    keywords: Tuple[str, ...]           # first four lowercased words, for activation
+    evidence_keywords: Tuple[str, ...]  # first three lowercased words, for practice matching
+    keyword_set: FrozenSet[str]         # distinct activation keywords
+    evidence_pattern: Pattern[str]      # any evidence keyword, as a substring
+    universality_score: float           # depends only on the statement
+    applications: Tuple[str, ...]       # practical applications of the statement
+
+# What a system rests on, by its most common law type
+_FOUNDATION_DESCRIPTIONS: Mapping[TruthLaw, str] = MappingProxyType({
+    TruthLaw.DIVINE_LAW: "Divine revelation and eternal principles",
+    TruthLaw.NATURAL_LAW: "Observable natural phenomena and scientific method",
+    TruthLaw.MORAL_LAW: "Universal moral intuitions and ethical reasoning",
+    TruthLaw.SPIRITUAL_LAW: "Spiritual experience and growth principles",
+    TruthLaw.SOCIAL_LAW: "Social contract and human agreement",
+    TruthLaw.LOGICAL_LAW: "Rational thought and logical consistency"
+})
+
+# Verdict lines by utilization score band: below 0.4, from 0.4, from 0.6, from 0.8
+_VERDICT_THRESHOLDS = (0.4, 0.6, 0.8)
+_VERDICTS = (
+    "❌ CONCERNING: Weak truth foundation or poor utilization.",
+    "⚠️ MIXED: Some truth principles present but inconsistent application.",
+    "👍 GOOD: Solid truth utilization with room for improvement.",
+    "✅ EXCELLENT: Strong truth foundation and consistent application."
+)
+
+# Closing recommendations shared by every report
+_STANDARD_RECOMMENDATIONS = (
+    "💡 RECOMMENDATIONS:",
+    "• Apply Russell Nelson heart pattern: regular nourishment, exercise, avoid toxins",
+    "• Ensure consistency between stated principles and actual practices",
+    "• Seek truth from the highest sources (divine revelation, natural law, moral intuition)",
+    "• Regularly evaluate and adjust based on outcomes and fruits",
+    ""
+)
+
+# Known truth laws and their indicator principles, shared by every evaluator
+_KNOWN_TRUTH_LAWS: Mapping[TruthLaw, Tuple[str, ...]] = MappingProxyType({
+    TruthLaw.DIVINE_LAW: (
+        "Love God with all your heart, soul, mind, strength",
+        "Love your neighbor as yourself", 
+        "Truth is eternal and unchanging",
+        "God is the source of all truth",
+        "The Atonement of Christ is supreme truth",
+        "Moral agency is divine gift",
+        "All people have inherent worth and dignity"
+    ),
+
+    TruthLaw.NATURAL_LAW: (
+        "Actions have consequences",
+        "Energy cannot be created or destroyed",
+        "Living things require sustenance",
+        "Gravity affects all matter",
+        "Cause and effect relationships exist",
+        "Growth requires proper conditions",
+        "Systems tend toward entropy without input"
+    ),
+
+    TruthLaw.MORAL_LAW: (
+        "Do unto others as you would have them do unto you",
+        "Honesty builds trust, deception destroys it",
+        "Justice requires treating equals equally",
+        "Mercy can override strict justice",
+        "Protecting innocent is moral imperative",
+        "Promises should be kept",
+        "Taking responsibility for actions is required"
+    ),
+
+    TruthLaw.SPIRITUAL_LAW: (
+        "Faith precedes miracles",
+        "Repentance enables spiritual growth",
+        "Service to others brings spiritual fulfillment",
+        "Prayer connects finite to infinite",
+        "Scripture study increases understanding",
+        "Gratitude increases spiritual sensitivity",
+        "Humility enables learning"
+    ),
+
+    TruthLaw.SOCIAL_LAW: (
+        "Trust is foundation of relationships",
+        "Communication prevents misunderstanding",
+        "Cooperation achieves more than competition",
+        "Leadership requires service",
+        "Communities need shared values",
+        "Conflict resolution requires empathy",
+        "Diversity strengthens groups when unified by common purpose"
+    ),
+
+    TruthLaw.LOGICAL_LAW: (
+        "A thing cannot both be and not be",
+        "If premises are true, conclusion follows",
+        "Evidence should support conclusions",
+        "Correlation does not imply causation",
+        "Extraordinary claims require extraordinary evidence",
+        "Internal consistency is required for truth",
+        "Simpler explanations are often better"
+    )
+})
+
+# Patterns for evaluating truth system health
+_EVALUATION_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "healthy_indicators": (
+        "consistent application of principles",
+        "openness to truth from multiple sources",
+        "humility when confronted with error",
+        "practical positive outcomes",
+        "growth and improvement over time",
+        "service orientation",
+        "integration rather than contradiction"
+    ),
+
+    "warning_signs": (
+        "pride and unteachability",
+        "selective application of principles",
+        "defensiveness about contradictions",
+        "harm to innocent people",
+        "stagnation or decline",
+        "self-serving orientation",
+        "internal contradictions ignored"
+    ),
+
+    "russell_nelson_heart_pattern": (
+        "Regular spiritual nourishment (scripture study/prayer like food)",
+        "Exercise of faith (spiritual exercise like physical exercise)",
+        "Avoiding spiritual toxins (sin like avoiding poisons)",
+        "Rest and renewal (Sabbath observance like sleep)",
+        "Community connection (fellowship like social health)",
+        "Growth and development (spiritual progression like physical growth)"
+    )
+})
+
+# Law types each kind of system needs, in the order gaps are reported
+_ESSENTIAL_FOR_TYPE: Mapping[TruthSystemType, Tuple[TruthLaw, ...]] = MappingProxyType({
+    TruthSystemType.RELIGIOUS: (TruthLaw.DIVINE_LAW, TruthLaw.MORAL_LAW, TruthLaw.SPIRITUAL_LAW),
+    TruthSystemType.SCIENTIFIC: (TruthLaw.NATURAL_LAW, TruthLaw.LOGICAL_LAW),
+    TruthSystemType.EDUCATIONAL: (TruthLaw.LOGICAL_LAW, TruthLaw.NATURAL_LAW, TruthLaw.MORAL_LAW),
+    TruthSystemType.POLITICAL: (TruthLaw.MORAL_LAW, TruthLaw.SOCIAL_LAW),
+    TruthSystemType.ORGANIZATIONAL: (TruthLaw.SOCIAL_LAW, TruthLaw.MORAL_LAW),
+    TruthSystemType.PERSONAL: (TruthLaw.MORAL_LAW, TruthLaw.SPIRITUAL_LAW)
+})
+
+def _utilization_score(avg_universality: float, avg_consistency: float,
+                       gap_count: int, contradiction_count: int) -> float:
+    """Combine average principle quality with gap and contradiction penalties, clamped to [0, 1]"""
+    # Plain float arithmetic only, so batch callers can score without any evaluator state
+    gap_penalty = gap_count * 0.1
+    contradiction_penalty = contradiction_count * 0.15
+    
+    score = (avg_universality + avg_consistency) / 2
+    score -= gap_penalty
+    score -= contradiction_penalty
+    
+    if score <= 0.0:
+        return 0.0
+    return score if score < 1.0 else 1.0
+
+def _calculate_universality(principle_lower: str) -> float:
+    """Calculate how universal/eternal a principle is"""
+    # Divine and moral laws are most universal
+    score = sum(0.15 for indicator in _UNIVERSAL_INDICATORS if indicator in principle_lower)
+    
+    return min(1.0, score + 0.1)  # Base score of 0.1
+
+def _identify_applications(principle_lower: str) -> Tuple[str, ...]:
+    """Identify practical applications of the principle"""
+    if "love" in principle_lower:
+        return ("Express care and concern for others", "Serve those in need")
+    if "truth" in principle_lower:
+        return ("Seek accurate information", "Speak honestly in communications")
+    if "justice" in principle_lower:
+        return ("Treat people fairly and equally", "Stand up for the innocent")
+    return ()
+
+def _build_principle_records() -> Tuple[_PrincipleRecord, ...]:
+    """Split and score each known principle once"""
+    records = []
+    for law_type, principles in _KNOWN_TRUTH_LAWS.items():
+        for principle in principles:
+            principle_lower = principle.lower()
+            words = principle_lower.split()
+            records.append(_PrincipleRecord(
+                statement=principle,
+                law_type=law_type,
+                keywords=tuple(words[:4]),
+                evidence_keywords=tuple(words[:3]),
+                keyword_set=frozenset(words[:4]),
+                evidence_pattern=re.compile("|".join(map(re.escape, words[:3]))),
+                universality_score=_calculate_universality(principle_lower),
+                applications=_identify_applications(principle_lower)
+            ))
+    return tuple(records)
+
+_PRINCIPLE_RECORDS = _build_principle_records()
+_KEYWORD_PATTERN, _KEYWORD_PREFIXES = compile_sweep(
+    {word for record in _PRINCIPLE_RECORDS for word in record.keywords}
+)
+
 class TruthSystemEvaluator:
     """
     Evaluates truth systems to identify what laws are in place
@@ -65,105 +317,12 @@ class TruthSystemEvaluator:
     """
     
     def __init__(self):
-        self.known_truth_laws = self._initialize_truth_laws()
-        self.evaluation_patterns = self._initialize_evaluation_patterns()
-    
-    def _initialize_truth_laws(self) -> Dict[TruthLaw, List[str]]:
-        """Initialize known truth laws and their indicators"""
-        return {
-            TruthLaw.DIVINE_LAW: [
-                "Love God with all your heart, soul, mind, strength",
-                "Love your neighbor as yourself", 
-                "Truth is eternal and unchanging",
-                "God is the source of all truth",
-                "The Atonement of Christ is supreme truth",
-                "Moral agency is divine gift",
-                "All people have inherent worth and dignity"
-            ],
-            
-            TruthLaw.NATURAL_LAW: [
-                "Actions have consequences",
-                "Energy cannot be created or destroyed",
-                "Living things require sustenance",
-                "Gravity affects all matter",
-                "Cause and effect relationships exist",
-                "Growth requires proper conditions",
-                "Systems tend toward entropy without input"
-            ],
-            
-            TruthLaw.MORAL_LAW: [
-                "Do unto others as you would have them do unto you",
-                "Honesty builds trust, deception destroys it",
-                "Justice requires treating equals equally",
-                "Mercy can override strict justice",
-                "Protecting innocent is moral imperative",
-                "Promises should be kept",
-                "Taking responsibility for actions is required"
-            ],
-            
-            TruthLaw.SPIRITUAL_LAW: [
-                "Faith precedes miracles",
-                "Repentance enables spiritual growth",
-                "Service to others brings spiritual fulfillment",
-                "Prayer connects finite to infinite",
-                "Scripture study increases understanding",
-                "Gratitude increases spiritual sensitivity",
-                "Humility enables learning"
-            ],
-            
-            TruthLaw.SOCIAL_LAW: [
-                "Trust is foundation of relationships",
-                "Communication prevents misunderstanding",
-                "Cooperation achieves more than competition",
-                "Leadership requires service",
-                "Communities need shared values",
-                "Conflict resolution requires empathy",
-                "Diversity strengthens groups when unified by common purpose"
-            ],
-            
-            TruthLaw.LOGICAL_LAW: [
-                "A thing cannot both be and not be",
-                "If premises are true, conclusion follows",
-                "Evidence should support conclusions",
-                "Correlation does not imply causation",
-                "Extraordinary claims require extraordinary evidence",
-                "Internal consistency is required for truth",
-                "Simpler explanations are often better"
-            ]
-        }
-    
-    def _initialize_evaluation_patterns(self) -> Dict[str, List[str]]:
-        """Initialize patterns for evaluating truth system health"""
-        return {
-            "healthy_indicators": [
-                "consistent application of principles",
-                "openness to truth from multiple sources",
-                "humility when confronted with error",
-                "practical positive outcomes",
-                "growth and improvement over time",
-                "service orientation",
-                "integration rather than contradiction"
-            ],
-            
-            "warning_signs": [
-                "pride and unteachability",
-                "selective application of principles",
-                "defensiveness about contradictions",
-                "harm to innocent people",
-                "stagnation or decline",
-                "self-serving orientation",
-                "internal contradictions ignored"
-            ],
-            
-            "russell_nelson_heart_pattern": [
-                "Regular spiritual nourishment (scripture study/prayer like food)",
-                "Exercise of faith (spiritual exercise like physical exercise)",
-                "Avoiding spiritual toxins (sin like avoiding poisons)",
-                "Rest and renewal (Sabbath observance like sleep)",
-                "Community connection (fellowship like social health)",
-                "Growth and development (spiritual progression like physical growth)"
-            ]
-        }
+        self.known_truth_laws = _KNOWN_TRUTH_LAWS
+        self.evaluation_patterns = _EVALUATION_PATTERNS
+        
+        # Evaluations depend only on the inputs, so repeated systems are served from an
+        # LRU dict (an lru_cache-wrapped bound method would keep the evaluator in a cycle)
+        self._evaluation_cache: "OrderedDict[Tuple[Any, ...], SystemEvaluation]" = OrderedDict()
     
     def evaluate_system(self, system_name: str, system_type: TruthSystemType, 
                        system_description: str, observed_practices: List[str],
@@ -172,11 +331,29 @@ class TruthSystemEvaluator:
         Main evaluation function - analyze what truth laws are in place
         and how effectively truth is being used
         """
-        if claimed_principles is None:
-            claimed_principles = []
-            
         logger.info(f"Evaluating truth system: {system_name}")
         
+        key = (system_name, system_type, system_description,
+               tuple(observed_practices), tuple(claimed_principles or ()))
+        cached = self._evaluation_cache.get(key)
+        if cached is not None:
+            self._evaluation_cache.move_to_end(key)
+            return cached
+        
+        evaluation = self._evaluate(*key)
+        self._evaluation_cache[key] = evaluation
+        if len(self._evaluation_cache) > _EVALUATION_CACHE_SIZE:
+            self._evaluation_cache.popitem(last=False)
+        return evaluation
+    
+    def clear_evaluation_cache(self):
+        """Forget memoized evaluations"""
+        self._evaluation_cache.clear()
+    
+    def _evaluate(self, system_name: str, system_type: TruthSystemType,
+                  system_description: str, observed_practices: Tuple[str, ...],
+                  claimed_principles: Tuple[str, ...]) -> SystemEvaluation:
+        """Evaluate a system from hashable inputs (memoized per evaluator)"""
         # Identify active principles
         active_principles = self._identify_active_principles(
             system_description, observed_practices, claimed_principles
@@ -205,11 +382,11 @@ class TruthSystemEvaluator:
         return SystemEvaluation(
             system_name=system_name,
             system_type=system_type,
-            active_principles=active_principles,
+            active_principles=tuple(active_principles),
             truth_foundation=truth_foundation,
             consistency_analysis=consistency_analysis,
-            gaps_identified=gaps_identified,
-            contradictions_found=contradictions_found,
+            gaps_identified=tuple(gaps_identified),
+            contradictions_found=tuple(contradictions_found),
             truth_utilization_score=truth_utilization_score,
             recommendation=recommendation
         )
@@ -218,42 +395,59 @@ class TruthSystemEvaluator:
                                   claims: List[str]) -> List[TruthPrinciple]:
         """Identify what truth principles are actually active in the system"""
         active_principles = []
-        full_text = f"{description} {' '.join(practices)} {' '.join(claims)}".lower()
-        
-        for law_type, principles in self.known_truth_laws.items():
-            for principle in principles:
-                if self._principle_is_active(principle, full_text, practices):
-                    # Calculate scores
-                    universality_score = self._calculate_universality(principle)
-                    consistency_score = self._calculate_consistency_with_practices(principle, practices)
-                    
-                    active_principles.append(TruthPrinciple(
-                        name=principle,
-                        law_type=law_type,
-                        statement=principle,
-                        source_authority=self._determine_source_authority(principle, law_type),
-                        evidence_supporting=self._find_supporting_evidence(principle, practices),
-                        contradictions_noted=self._find_contradictions(principle, practices),
-                        practical_applications=self._identify_applications(principle, practices),
-                        verification_method=self._determine_verification_method(law_type),
-                        universality_score=universality_score,
-                        consistency_score=consistency_score
-                    ))
+        
+        # Lowercase every input once; the helpers below share these
+        practices_lower = [practice.lower() for practice in practices]
+        practice_text = ' '.join(practices_lower)
+        full_text = f"{description.lower()} {practice_text} {' '.join(claims).lower()}"
+        
+        # One sweep per text finds every principle keyword it contains
+        full_keywords = self._find_keywords(full_text)
+        practice_keywords = self._find_keywords(practice_text)
+        
+        # Activation pass: cheap set tests decide which principles are present
+        active_records = [
+            record for record in _PRINCIPLE_RECORDS
+            if self._principle_is_active(record, full_keywords, practice_keywords)
+        ]
+        
+        # Scoring pass: only principles that survived get their evidence examined
+        for record in active_records:
+            principle = record.statement
+            
+            active_principles.append(TruthPrinciple(
+                name=principle,
+                law_type=record.law_type,
+                statement=principle,
+                evidence_supporting=tuple(self._find_supporting_evidence(record, practices, practices_lower)),
+                contradictions_noted=tuple(self._find_contradictions(principle, practices)),
+                practical_applications=record.applications,
+                universality_score=record.universality_score,
+                consistency_score=self._calculate_consistency_with_practices(record, practices_lower, practice_keywords)
+            ))
         
         return active_principles
     
-    def _principle_is_active(self, principle: str, full_text: str, practices: List[str]) -> bool:
+    def _find_keywords(self, text_lower: str) -> FrozenSet[str]:
+        """Return every principle keyword occurring in the lowercased text"""
+        found = set()
+        for keyword in _KEYWORD_PATTERN.findall(text_lower):
+            found |= _KEYWORD_PREFIXES[keyword]
+        return frozenset(found)
+    
+    def _principle_is_active(self, record: _PrincipleRecord, full_keywords: AbstractSet[str],
+                             practice_keywords: AbstractSet[str]) -> bool:
         """Determine if a principle is actively present in the system"""
-        principle_keywords = principle.lower().split()[:4]  # Key words from principle
-        
-        # Check for keyword matches
-        keyword_matches = sum(1 for word in principle_keywords if word in full_text)
-        if keyword_matches >= 2:
-            return True
+        # Check for keyword matches, stopping at the second one
+        keyword_matches = 0
+        for word in record.keywords:
+            if word in full_keywords:
+                keyword_matches += 1
+                if keyword_matches >= 2:
+                    return True
         
         # Check for behavioral evidence in practices
-        practice_text = ' '.join(practices).lower()
-        if any(word in practice_text for word in principle_keywords):
+        if not record.keyword_set.isdisjoint(practice_keywords):
             return True
         
         return False
@@ -263,42 +457,38 @@ class TruthSystemEvaluator:
         if not principles:
             return "No clear truth foundation identified"
         
-        # Count by law types
-        law_counts = {}
-        for principle in principles:
-            law_counts[principle.law_type] = law_counts.get(principle.law_type, 0) + 1
-        
-        primary_law_type = max(law_counts, key=law_counts.get)
-        
-        foundation_descriptions = {
-            TruthLaw.DIVINE_LAW: "Divine revelation and eternal principles",
-            TruthLaw.NATURAL_LAW: "Observable natural phenomena and scientific method",
-            TruthLaw.MORAL_LAW: "Universal moral intuitions and ethical reasoning",
-            TruthLaw.SPIRITUAL_LAW: "Spiritual experience and growth principles",
-            TruthLaw.SOCIAL_LAW: "Social contract and human agreement",
-            TruthLaw.LOGICAL_LAW: "Rational thought and logical consistency"
-        }
+        # Count by law types; ties go to the law type seen first
+        law_counts = Counter(principle.law_type for principle in principles)
+        primary_law_type, _ = law_counts.most_common(1)[0]
         
-        return foundation_descriptions.get(primary_law_type, "Mixed foundation")
+        return _FOUNDATION_DESCRIPTIONS[primary_law_type]
     
     def _analyze_consistency(self, principles: List[TruthPrinciple], 
-                           practices: List[str]) -> Dict[str, Any]:
+                           practices: List[str]) -> Mapping[str, Any]:
         """Analyze how consistently principles are applied"""
         if not principles:
-            return {"overall_consistency": 0.0, "analysis": "No principles to analyze"}
+            return MappingProxyType({"overall_consistency": 0.0, "analysis": "No principles to analyze"})
         
-        consistency_scores = [p.consistency_score for p in principles]
-        overall_consistency = sum(consistency_scores) / len(consistency_scores)
+        # One pass totals the scores and partitions names into high and low
+        total = 0.0
+        high_consistency = []
+        low_consistency = []
+        for principle in principles:
+            score = principle.consistency_score
+            total += score
+            if score > 0.8:
+                high_consistency.append(principle.name)
+            elif score < 0.5:
+                low_consistency.append(principle.name)
         
-        high_consistency = [p for p in principles if p.consistency_score > 0.8]
-        low_consistency = [p for p in principles if p.consistency_score < 0.5]
+        overall_consistency = total / len(principles)
         
-        return {
+        return MappingProxyType({
             "overall_consistency": overall_consistency,
-            "high_consistency_principles": [p.name for p in high_consistency],
-            "low_consistency_principles": [p.name for p in low_consistency],
+            "high_consistency_principles": tuple(high_consistency),
+            "low_consistency_principles": tuple(low_consistency),
             "analysis": f"System shows {overall_consistency:.2f} consistency in applying stated principles"
-        }
+        })
     
     def _identify_gaps(self, system_type: TruthSystemType, 
                       principles: List[TruthPrinciple]) -> List[str]:
@@ -306,21 +496,12 @@ class TruthSystemEvaluator:
         active_law_types = {p.law_type for p in principles}
         
         # Essential principles for different system types
-        essential_for_type = {
-            TruthSystemType.RELIGIOUS: [TruthLaw.DIVINE_LAW, TruthLaw.MORAL_LAW, TruthLaw.SPIRITUAL_LAW],
-            TruthSystemType.SCIENTIFIC: [TruthLaw.NATURAL_LAW, TruthLaw.LOGICAL_LAW],
-            TruthSystemType.EDUCATIONAL: [TruthLaw.LOGICAL_LAW, TruthLaw.NATURAL_LAW, TruthLaw.MORAL_LAW],
-            TruthSystemType.POLITICAL: [TruthLaw.MORAL_LAW, TruthLaw.SOCIAL_LAW],
-            TruthSystemType.ORGANIZATIONAL: [TruthLaw.SOCIAL_LAW, TruthLaw.MORAL_LAW],
-            TruthSystemType.PERSONAL: [TruthLaw.MORAL_LAW, TruthLaw.SPIRITUAL_LAW]
-        }
-        
-        required_types = essential_for_type.get(system_type, [])
+        required_types = _ESSENTIAL_FOR_TYPE.get(system_type, ())
         missing_types = [law_type for law_type in required_types if law_type not in active_law_types]
         
         gaps = []
         for missing_type in missing_types:
-            gaps.append(f"Missing {missing_type.value.replace('_', ' ').title()} principles")
+            gaps.append(f"Missing {_LAW_TITLES[missing_type]} principles")
         
         return gaps
     
@@ -337,73 +518,45 @@ class TruthSystemEvaluator:
         return contradictions
     
     def _calculate_truth_utilization(self, principles: List[TruthPrinciple], 
-                                   consistency: Dict[str, Any], gaps: List[str], 
+                                   consistency: Mapping[str, Any], gaps: List[str], 
                                    contradictions: List[str]) -> float:
         """Calculate overall score for how well truth is being utilized"""
         if not principles:
             return 0.0
         
         # Base score from principle quality
-        avg_universality = sum(p.universality_score for p in principles) / len(principles)
+        avg_universality = sum(map(_UNIVERSALITY_SCORE, principles)) / len(principles)
         avg_consistency = consistency["overall_consistency"]
         
-        # Penalties for gaps and contradictions
-        gap_penalty = len(gaps) * 0.1
-        contradiction_penalty = len(contradictions) * 0.15
-        
-        score = (avg_universality + avg_consistency) / 2
-        score -= gap_penalty
-        score -= contradiction_penalty
-        
-        return max(0.0, min(1.0, score))
+        return _utilization_score(avg_universality, avg_consistency, len(gaps), len(contradictions))
     
-    def _calculate_universality(self, principle: str) -> float:
-        """Calculate how universal/eternal a principle is"""
-        # Divine and moral laws are most universal
-        principle_lower = principle.lower()
-        
-        universal_indicators = ["love", "truth", "justice", "mercy", "honesty", "service"]
-        score = sum(0.15 for indicator in universal_indicators if indicator in principle_lower)
-        
-        return min(1.0, score + 0.1)  # Base score of 0.1
-    
-    def _calculate_consistency_with_practices(self, principle: str, practices: List[str]) -> float:
+    def _calculate_consistency_with_practices(self, record: _PrincipleRecord, practices_lower: List[str],
+                                              practice_keywords: AbstractSet[str]) -> float:
         """Calculate how consistently a principle is applied in practice"""
-        if not practices:
+        if not practices_lower:
             return 0.5  # Neutral if no practices to evaluate
         
-        principle_keywords = principle.lower().split()[:3]
-        practice_text = ' '.join(practices).lower()
+        principle_keywords = record.evidence_keywords
         
-        matches = sum(1 for word in principle_keywords if word in practice_text)
+        matches = sum(1 for word in principle_keywords if word in practice_keywords)
         return min(1.0, matches / len(principle_keywords))
     
-    def _determine_source_authority(self, principle: str, law_type: TruthLaw) -> str:
-        """Determine the source of authority for a principle"""
-        authority_map = {
-            TruthLaw.DIVINE_LAW: "Scripture and revelation",
-            TruthLaw.NATURAL_LAW: "Observation and scientific method",
-            TruthLaw.MORAL_LAW: "Universal moral intuition and reasoning",
-            TruthLaw.SPIRITUAL_LAW: "Spiritual experience and religious teaching",
-            TruthLaw.SOCIAL_LAW: "Social contract and cultural agreement",
-            TruthLaw.LOGICAL_LAW: "Rational thought and philosophical reasoning"
-        }
-        return authority_map.get(law_type, "Unknown authority")
-    
-    def _find_supporting_evidence(self, principle: str, practices: List[str]) -> List[str]:
+    def _find_supporting_evidence(self, record: _PrincipleRecord, practices: List[str],
+                                  practices_lower: List[str]) -> List[str]:
         """Find evidence that supports the principle"""
         evidence = []
-        principle_lower = principle.lower()
         
-        # Look for practices that align with the principle
-        for practice in practices:
-            if any(word in practice.lower() for word in principle_lower.split()[:3]):
+        # Look for practices that align with the principle, keeping the first 3
+        for practice, practice_lower in zip(practices, practices_lower):
+            if record.evidence_pattern.search(practice_lower):
                 evidence.append(f"Practice: {practice}")
+                if len(evidence) == 3:
+                    break
         
         if not evidence:
             evidence.append("Principle stated but limited evidence in practices")
         
-        return evidence[:3]  # Limit to top 3
+        return evidence
     
     def _find_contradictions(self, principle: str, practices: List[str]) -> List[str]:
         """Find contradictions to the principle"""
@@ -413,70 +566,32 @@ class TruthSystemEvaluator:
         # For now, return empty list
         return contradictions
     
-    def _identify_applications(self, principle: str, practices: List[str]) -> List[str]:
-        """Identify practical applications of the principle"""
-        applications = []
-        principle_lower = principle.lower()
-        
-        if "love" in principle_lower:
-            applications.append("Express care and concern for others")
-            applications.append("Serve those in need")
-        elif "truth" in principle_lower:
-            applications.append("Seek accurate information")
-            applications.append("Speak honestly in communications")
-        elif "justice" in principle_lower:
-            applications.append("Treat people fairly and equally")
-            applications.append("Stand up for the innocent")
-        
-        return applications[:3]  # Limit to top 3
-    
-    def _determine_verification_method(self, law_type: TruthLaw) -> str:
-        """Determine how this type of law can be verified"""
-        verification_methods = {
-            TruthLaw.DIVINE_LAW: "Spiritual confirmation and scriptural consistency",
-            TruthLaw.NATURAL_LAW: "Scientific experiment and observation",
-            TruthLaw.MORAL_LAW: "Practical outcomes and universal consensus",
-            TruthLaw.SPIRITUAL_LAW: "Personal experience and spiritual fruits",
-            TruthLaw.SOCIAL_LAW: "Social outcomes and collective agreement",
-            TruthLaw.LOGICAL_LAW: "Logical consistency and rational analysis"
-        }
-        return verification_methods.get(law_type, "Multiple verification methods")
-    
     def _generate_recommendation(self, system_name: str, score: float, 
                                gaps: List[str], contradictions: List[str]) -> str:
         """Generate recommendations for improving truth utilization"""
-        recommendation = f"Truth System Analysis for {system_name}:\n\n"
-        
-        if score >= 0.8:
-            recommendation += "✅ EXCELLENT: Strong truth foundation and consistent application.\n"
-        elif score >= 0.6:
-            recommendation += "👍 GOOD: Solid truth utilization with room for improvement.\n"
-        elif score >= 0.4:
-            recommendation += "⚠️ MIXED: Some truth principles present but inconsistent application.\n"
-        else:
-            recommendation += "❌ CONCERNING: Weak truth foundation or poor utilization.\n"
-        
-        recommendation += f"Truth Utilization Score: {score:.2f}/1.0\n\n"
+        parts = [
+            f"Truth System Analysis for {system_name}:",
+            "",
+            _VERDICTS[bisect_right(_VERDICT_THRESHOLDS, score)],
+            f"Truth Utilization Score: {score:.2f}/1.0",
+            ""
+        ]
         
         if gaps:
-            recommendation += "🎯 GAPS TO ADDRESS:\n"
+            parts.append("🎯 GAPS TO ADDRESS:")
             for gap in gaps[:3]:
-                recommendation += f"• {gap}\n"
-            recommendation += "\n"
+                parts.append(f"• {gap}")
+            parts.append("")
         
         if contradictions:
-            recommendation += "⚠️ CONTRADICTIONS TO RESOLVE:\n"
+            parts.append("⚠️ CONTRADICTIONS TO RESOLVE:")
             for contradiction in contradictions[:3]:
-                recommendation += f"• {contradiction}\n"
-            recommendation += "\n"
+                parts.append(f"• {contradiction}")
+            parts.append("")
         
-        recommendation += "💡 RECOMMENDATIONS:\n"
-        recommendation += "• Apply Russell Nelson heart pattern: regular nourishment, exercise, avoid toxins\n"
-        recommendation += "• Ensure consistency between stated principles and actual practices\n"
-        recommendation += "• Seek truth from the highest sources (divine revelation, natural law, moral intuition)\n"
-        recommendation += "• Regularly evaluate and adjust based on outcomes and fruits\n"
+        parts.extend(_STANDARD_RECOMMENDATIONS)
         
-        return recommendation
+        return "\n".join(parts)
     
     def evaluate_russell_nelson_heart_system(self) -> SystemEvaluation:
         """Example evaluation of Russell Nelson's heart analogy system"""
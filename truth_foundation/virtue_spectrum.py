@@ -5,15 +5,53 @@ Analyzes actions and attitudes along the spectrum of virtue and vice
 with temperance (moderation) as the key to righteous balance
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Any, Set, Tuple
 from enum import Enum
 import logging
-from .core_truths import TruthStatement, TruthLevel
 from .gospel_definitions import GospelDefinitions
+from ._keyword_trie import compile_sweep
+from ._spectrum_kernel import best_positions
 
 logger = logging.getLogger(__name__)
 
+_ANALYSIS_CACHE_SIZE = 1024
+
+# Static sections of the virtue spectrum report
+_REPORT_HEADER = (
+    "🌟 VIRTUE-VICE SPECTRUM ANALYSIS\n"
+    f"{'=' * 50}\n\n"
+)
+_SECTION_RULE = f"{'-' * 40}\n\n"
+_REPORT_FOOTER = (
+    "🎯 REMEMBER: The goal is temperance - virtue balanced with wisdom.\n"
+    "'In all things there must be moderation' - Gospel principle\n"
+    "Seek the Spirit to guide you toward Christ's perfect balance."
+)
+
+# Gospel guidance, with the body chosen by which side of temperance a position falls
+_GUIDANCE_TEMPLATE = (
+    "Gospel Guidance on {name}:\n\n"
+    "📖 Christ's Example: {connection}\n\n"
+    "{body}"
+    "\n💡 Key Scripture: {scripture}"
+)
+_GUIDANCE_TEMPERATE = (
+    "✅ You're reflecting Christ's balanced approach to this virtue.\n"
+    "Continue to let the Spirit guide you in maintaining this balance.\n"
+)
+_GUIDANCE_DEFICIENT = (
+    "🙏 Prayer Focus: Ask God to help you develop {virtue}.\n"
+    "📚 Study how Christ demonstrated {virtue} in His life.\n"
+    "🛠️ Practice: Look for daily opportunities to grow in this virtue.\n"
+)
+_GUIDANCE_EXCESSIVE = (
+    "⚖️ Seek Balance: Even virtues need wisdom and moderation.\n"
+    "🤔 Reflect: Is your {virtue} serving others or becoming prideful?\n"
+    "📖 Remember: Christ was perfectly balanced in all virtues.\n"
+)
+
 class VirtueCategory(Enum):
     """Categories of virtue based on classical and Gospel traditions"""
     CARDINAL = "cardinal"       # Prudence, Justice, Fortitude, Temperance
@@ -40,10 +78,48 @@ class VirtueSpectrum:
     excess_vice: str          # Too much of this virtue
     temperate_middle: str     # The balanced expression
     scripture_references: List[str]
-    practical_examples: Dict[SpectrumPosition, List[str]]
+    practical_examples: Tuple[Tuple[str, ...], ...]  # indexed by SpectrumPosition.value - 1
     gospel_connection: str
+    _name_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _example_keys: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _word_bits: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _example_masks: Tuple[Tuple[Tuple[int, ...], ...], ...] = field(init=False, repr=False, compare=False)
+    _example_lens: Tuple[Tuple[int, ...], ...] = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        # Lowercased matching data, split once rather than on every analysis
+        self._name_keys = (self.virtue_name.lower(), self.deficiency_vice.lower(), self.excess_vice.lower())
+        position_words = tuple(
+            tuple(tuple(example.lower().split()) for example in examples)
+            for examples in self.practical_examples
+        )
+        # The first three words of each example mark an action as relevant
+        self._example_keys = frozenset(
+            word for examples in position_words for words in examples for word in words[:3]
+        )
+        
+        # Encode example words as bits for the scoring kernel
+        self._word_bits = {}
+        for examples in position_words:
+            for words in examples:
+                for word in words:
+                    self._word_bits.setdefault(word, 1 << len(self._word_bits))
+        self._example_masks = tuple(
+            tuple(self._encode_example(words) for words in examples) for examples in position_words
+        )
+        self._example_lens = tuple(
+            tuple(len(words) for words in examples) for examples in position_words
+        )
+
+    def _encode_example(self, words: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Masks of the words occurring at least once, twice, ... in an example"""
+        counts = Counter(words)
+        return tuple(
+            sum(self._word_bits[word] for word, count in counts.items() if count >= layer)
+            for layer in range(1, max(counts.values(), default=0) + 1)
+        )
+
+@dataclass(frozen=True, slots=True)
 class SpectrumAnalysis:
     """Analysis of where an action/attitude falls on virtue-vice spectrum"""
     analyzed_item: str
@@ -51,7 +127,7 @@ class SpectrumAnalysis:
     position: SpectrumPosition
     position_score: float  # 1.0 (extreme vice) to 6.0 (extreme excess)
     temperance_distance: float  # How far from ideal temperance
-    recommendations: List[str]
+    recommendations: Tuple[str, ...]
     gospel_guidance: str
 
 class VirtueSpectrumAnalyzer:
@@ -63,6 +139,15 @@ class VirtueSpectrumAnalyzer:
     def __init__(self):
         self.gospel_definitions = GospelDefinitions()
         self.virtue_spectrums = self._initialize_virtue_spectrums()
+        self._keyword_index = self._build_keyword_index()
+        self._keyword_pattern, self._keyword_prefixes = compile_sweep(
+            self._keyword_index.keys() | {
+                word for spectrum in self.virtue_spectrums.values() for word in spectrum._word_bits
+            }
+        )
+        
+        # Analyses depend only on the action text, so repeats are served from an LRU cache
+        self._analysis_cache: "OrderedDict[str, Tuple[SpectrumAnalysis, ...]]" = OrderedDict()
         
     def _initialize_virtue_spectrums(self) -> Dict[str, VirtueSpectrum]:
         """Initialize virtue spectrums based on classical and Gospel wisdom"""
@@ -79,14 +164,14 @@ class VirtueSpectrumAnalyzer:
                     "1 Corinthians 16:13 - Be strong, be courageous",
                     "D&C 27:15 - Take the sword of the Spirit"
                 ],
-                practical_examples={
-                    SpectrumPosition.EXTREME_VICE: ["Paralyzing fear", "Abandoning principles under pressure"],
-                    SpectrumPosition.VICE: ["Avoiding necessary confrontations", "Remaining silent when truth is attacked"],
-                    SpectrumPosition.DEFICIENCY: ["Hesitating to speak up", "Avoiding reasonable risks"],
-                    SpectrumPosition.TEMPERANCE: ["Standing for truth with wisdom", "Calculated courage for righteous causes"],
-                    SpectrumPosition.EXCESS: ["Unnecessary confrontation", "Taking foolish risks"],
-                    SpectrumPosition.EXTREME_EXCESS: ["Reckless endangerment", "Fighting every battle regardless of wisdom"]
-                },
+                practical_examples=(
+                    ("Paralyzing fear", "Abandoning principles under pressure"),  # EXTREME_VICE
+                    ("Avoiding necessary confrontations", "Remaining silent when truth is attacked"),  # VICE
+                    ("Hesitating to speak up", "Avoiding reasonable risks"),  # DEFICIENCY
+                    ("Standing for truth with wisdom", "Calculated courage for righteous causes"),  # TEMPERANCE
+                    ("Unnecessary confrontation", "Taking foolish risks"),  # EXCESS
+                    ("Reckless endangerment", "Fighting every battle regardless of wisdom")  # EXTREME_EXCESS
+                ),
                 gospel_connection="Christ showed perfect courage - bold in teaching truth, yet wise in timing"
             ),
             
@@ -102,14 +187,14 @@ class VirtueSpectrumAnalyzer:
                     "D&C 104:18 - For the earth is full, and there is enough and to spare",
                     "Luke 6:38 - Give, and it shall be given unto you"
                 ],
-                practical_examples={
-                    SpectrumPosition.EXTREME_VICE: ["Hoarding when others suffer", "Stealing from others"],
-                    SpectrumPosition.VICE: ["Refusing to help when able", "Excessive materialism"],
-                    SpectrumPosition.DEFICIENCY: ["Rarely sharing resources", "Hesitant to serve"],
-                    SpectrumPosition.TEMPERANCE: ["Giving wisely according to need", "Generous service with wisdom"],
-                    SpectrumPosition.EXCESS: ["Giving beyond family needs", "Enabling dependency"],
-                    SpectrumPosition.EXTREME_EXCESS: ["Giving away needed family resources", "Creating harmful dependency"]
-                },
+                practical_examples=(
+                    ("Hoarding when others suffer", "Stealing from others"),  # EXTREME_VICE
+                    ("Refusing to help when able", "Excessive materialism"),  # VICE
+                    ("Rarely sharing resources", "Hesitant to serve"),  # DEFICIENCY
+                    ("Giving wisely according to need", "Generous service with wisdom"),  # TEMPERANCE
+                    ("Giving beyond family needs", "Enabling dependency"),  # EXCESS
+                    ("Giving away needed family resources", "Creating harmful dependency")  # EXTREME_EXCESS
+                ),
                 gospel_connection="Christ gave His life - ultimate generosity balanced with wisdom about timing"
             ),
             
@@ -125,14 +210,14 @@ class VirtueSpectrumAnalyzer:
                     "Ether 12:27 - If men come unto me I will show them their weakness",
                     "Matthew 5:3 - Blessed are the poor in spirit"
                 ],
-                practical_examples={
-                    SpectrumPosition.EXTREME_VICE: ["Narcissistic arrogance", "Refusing to acknowledge mistakes"],
-                    SpectrumPosition.VICE: ["Unwillingness to learn", "Looking down on others"],
-                    SpectrumPosition.DEFICIENCY: ["Occasional pride", "Difficulty accepting correction"],
-                    SpectrumPosition.TEMPERANCE: ["Teachable confidence", "Acknowledging strengths and weaknesses honestly"],
-                    SpectrumPosition.EXCESS: ["Self-hatred", "Refusing to acknowledge gifts"],
-                    SpectrumPosition.EXTREME_EXCESS: ["Paralyzing self-doubt", "False humility as manipulation"]
-                },
+                practical_examples=(
+                    ("Narcissistic arrogance", "Refusing to acknowledge mistakes"),  # EXTREME_VICE
+                    ("Unwillingness to learn", "Looking down on others"),  # VICE
+                    ("Occasional pride", "Difficulty accepting correction"),  # DEFICIENCY
+                    ("Teachable confidence", "Acknowledging strengths and weaknesses honestly"),  # TEMPERANCE
+                    ("Self-hatred", "Refusing to acknowledge gifts"),  # EXCESS
+                    ("Paralyzing self-doubt", "False humility as manipulation")  # EXTREME_EXCESS
+                ),
                 gospel_connection="Christ was perfectly humble - confident in His mission yet submissive to the Father"
             ),
             
@@ -148,14 +233,14 @@ class VirtueSpectrumAnalyzer:
                     "Alma 42:15 - Mercy cannot rob justice",
                     "D&C 88:40 - Intelligence cleaveth unto intelligence"
                 ],
-                practical_examples={
-                    SpectrumPosition.EXTREME_VICE: ["Corrupt favoritism", "Punishing the innocent"],
-                    SpectrumPosition.VICE: ["Showing partiality", "Ignoring clear wrongdoing"],
-                    SpectrumPosition.DEFICIENCY: ["Inconsistent standards", "Avoiding difficult decisions"],
-                    SpectrumPosition.TEMPERANCE: ["Fair consequences with mercy", "Equal treatment with compassion"],
-                    SpectrumPosition.EXCESS: ["Harsh inflexibility", "Punishment without mercy"],
-                    SpectrumPosition.EXTREME_EXCESS: ["Cruel retribution", "Justice without love"]
-                },
+                practical_examples=(
+                    ("Corrupt favoritism", "Punishing the innocent"),  # EXTREME_VICE
+                    ("Showing partiality", "Ignoring clear wrongdoing"),  # VICE
+                    ("Inconsistent standards", "Avoiding difficult decisions"),  # DEFICIENCY
+                    ("Fair consequences with mercy", "Equal treatment with compassion"),  # TEMPERANCE
+                    ("Harsh inflexibility", "Punishment without mercy"),  # EXCESS
+                    ("Cruel retribution", "Justice without love")  # EXTREME_EXCESS
+                ),
                 gospel_connection="God's justice perfectly balanced with mercy through Christ's Atonement"
             ),
             
@@ -171,67 +256,85 @@ class VirtueSpectrumAnalyzer:
                     "Galatians 5:22-23 - Fruit of the Spirit includes temperance",
                     "D&C 89 - Word of Wisdom principles"
                 ],
-                practical_examples={
-                    SpectrumPosition.EXTREME_VICE: ["Addiction and compulsion", "Complete lack of self-control"],
-                    SpectrumPosition.VICE: ["Regular overindulgence", "Impulse-driven decisions"],
-                    SpectrumPosition.DEFICIENCY: ["Occasional excess", "Weak self-discipline"],
-                    SpectrumPosition.TEMPERANCE: ["Moderate enjoyment", "Self-control with balance"],
-                    SpectrumPosition.EXCESS: ["Extreme restriction", "Refusing all pleasures"],
-                    SpectrumPosition.EXTREME_EXCESS: ["Harmful asceticism", "Denying necessary goods"]
-                ],
+                practical_examples=(
+                    ("Addiction and compulsion", "Complete lack of self-control"),  # EXTREME_VICE
+                    ("Regular overindulgence", "Impulse-driven decisions"),  # VICE
+                    ("Occasional excess", "Weak self-discipline"),  # DEFICIENCY
+                    ("Moderate enjoyment", "Self-control with balance"),  # TEMPERANCE
+                    ("Extreme restriction", "Refusing all pleasures"),  # EXCESS
+                    ("Harmful asceticism", "Denying necessary goods")  # EXTREME_EXCESS
+                ),
                 gospel_connection="Christ fasted but also feasted - perfect balance in all things"
             )
         }
     
+    def _build_keyword_index(self) -> Dict[str, Set[str]]:
+        """Map each relevance keyword to the keys of the spectrums it belongs to"""
+        index: Dict[str, Set[str]] = {}
+        for key, spectrum in self.virtue_spectrums.items():
+            for keyword in (*spectrum._name_keys, *spectrum._example_keys):
+                index.setdefault(keyword, set()).add(key)
+        return index
+    
     def analyze_virtue_spectrum(self, action_or_attitude: str, context: Dict[str, Any] = None) -> List[SpectrumAnalysis]:
-        """Analyze an action or attitude against relevant virtue spectrums"""
-        if context is None:
-            context = {}
-            
+        """Analyze an action or attitude against relevant virtue spectrums
+        
+        context is accepted for compatibility but does not affect the analysis.
+        """
+        cached = self._analysis_cache.get(action_or_attitude)
+        if cached is not None:
+            self._analysis_cache.move_to_end(action_or_attitude)
+            return list(cached)
+        
+        analyses = tuple(self._analyze(action_or_attitude))
+        self._analysis_cache[action_or_attitude] = analyses
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return list(analyses)
+    
+    def clear_analysis_cache(self):
+        """Forget memoized analyses"""
+        self._analysis_cache.clear()
+    
+    def _analyze(self, action_or_attitude: str) -> List[SpectrumAnalysis]:
+        """Analyze an action against every relevant spectrum"""
         analyses = []
         action_lower = action_or_attitude.lower()
         
-        # Find relevant virtue spectrums
-        relevant_spectrums = []
-        for spectrum in self.virtue_spectrums.values():
-            if self._is_spectrum_relevant(action_lower, spectrum):
-                relevant_spectrums.append(spectrum)
+        # Find relevant virtue spectrums from every keyword in the action
+        action_words = self._find_keywords(action_lower)
+        keyword_index = self._keyword_index
+        relevant_keys = set()
+        for keyword in action_words:
+            if keyword in keyword_index:
+                relevant_keys |= keyword_index[keyword]
+        relevant_spectrums = [
+            spectrum for key, spectrum in self.virtue_spectrums.items() if key in relevant_keys
+        ]
         
         # If no specific match, analyze against temperance as default
         if not relevant_spectrums:
             relevant_spectrums = [self.virtue_spectrums["temperance"]]
         
-        for spectrum in relevant_spectrums:
-            analysis = self._analyze_against_spectrum(action_or_attitude, spectrum, context)
+        # Score every relevant spectrum in one kernel pass
+        placements = self._determine_spectrum_positions(action_words, relevant_spectrums)
+        
+        for spectrum, (position, score) in zip(relevant_spectrums, placements):
+            analysis = self._analyze_against_spectrum(action_or_attitude, spectrum, position, score)
             analyses.append(analysis)
         
         return analyses
     
-    def _is_spectrum_relevant(self, action_lower: str, spectrum: VirtueSpectrum) -> bool:
-        """Determine if a virtue spectrum is relevant to the action"""
-        # Check virtue name
-        if spectrum.virtue_name.lower() in action_lower:
-            return True
-        
-        # Check vice names
-        if spectrum.deficiency_vice.lower() in action_lower or spectrum.excess_vice.lower() in action_lower:
-            return True
-        
-        # Check practical examples
-        for examples_list in spectrum.practical_examples.values():
-            for example in examples_list:
-                if any(word in action_lower for word in example.lower().split()[:3]):
-                    return True
-        
-        return False
+    def _find_keywords(self, action_lower: str) -> FrozenSet[str]:
+        """Return every keyword and example word occurring in the lowercased action, in one sweep"""
+        found = set()
+        for keyword in self._keyword_pattern.findall(action_lower):
+            found |= self._keyword_prefixes[keyword]
+        return frozenset(found)
     
-    def _analyze_against_spectrum(self, action: str, spectrum: VirtueSpectrum, context: Dict[str, Any]) -> SpectrumAnalysis:
-        """Analyze specific action against a virtue spectrum"""
-        action_lower = action.lower()
-        
-        # Determine position on spectrum
-        position, score = self._determine_spectrum_position(action_lower, spectrum)
-        
+    def _analyze_against_spectrum(self, action: str, spectrum: VirtueSpectrum,
+                                  position: SpectrumPosition, score: float) -> SpectrumAnalysis:
+        """Analyze specific action against a virtue spectrum, given its position on it"""
         # Calculate distance from temperance (ideal is 4.0)
         temperance_distance = abs(score - 4.0)
         
@@ -247,31 +350,35 @@ class VirtueSpectrumAnalyzer:
             position=position,
             position_score=score,
             temperance_distance=temperance_distance,
-            recommendations=recommendations,
+            recommendations=tuple(recommendations),
             gospel_guidance=gospel_guidance
         )
     
-    def _determine_spectrum_position(self, action_lower: str, spectrum: VirtueSpectrum) -> tuple[SpectrumPosition, float]:
-        """Determine where action falls on the virtue spectrum"""
-        # Score based on matching examples at each position
-        position_scores = {}
+    def _determine_spectrum_positions(self, action_words: FrozenSet[str],
+                                      spectrums: List[VirtueSpectrum]) -> List[Tuple[SpectrumPosition, float]]:
+        """Determine where action falls on each virtue spectrum"""
+        # Score based on matching examples at each position, as a mask of the action's words per spectrum
+        action_masks = []
+        for spectrum in spectrums:
+            word_bits = spectrum._word_bits
+            action_mask = 0
+            for word in action_words:
+                action_mask |= word_bits.get(word, 0)
+            action_masks.append(action_mask)
         
-        for position, examples in spectrum.practical_examples.items():
-            score = 0
-            for example in examples:
-                example_words = example.lower().split()
-                matches = sum(1 for word in example_words if word in action_lower)
-                if matches > 0:
-                    score += matches / len(example_words)
-            position_scores[position] = score
+        # Best position index per spectrum; scores are indexed by position value - 1
+        best_indexes = best_positions(
+            tuple(action_masks),
+            tuple(spectrum._example_masks for spectrum in spectrums),
+            tuple(spectrum._example_lens for spectrum in spectrums)
+        )
         
-        # Find position with highest score
-        if not position_scores or max(position_scores.values()) == 0:
+        placements = []
+        for best_index in best_indexes:
             # Default to temperance if no clear match
-            return SpectrumPosition.TEMPERANCE, 4.0
-        
-        best_position = max(position_scores, key=position_scores.get)
-        return best_position, float(best_position.value)
+            position = SpectrumPosition(best_index + 1) if best_index >= 0 else SpectrumPosition.TEMPERANCE
+            placements.append((position, float(position.value)))
+        return placements
     
     def _generate_recommendations(self, position: SpectrumPosition, spectrum: VirtueSpectrum, distance: float) -> List[str]:
         """Generate recommendations for achieving temperance"""
@@ -305,64 +412,51 @@ class VirtueSpectrumAnalyzer:
     
     def _generate_gospel_guidance(self, action: str, spectrum: VirtueSpectrum, position: SpectrumPosition) -> str:
         """Generate Gospel-centered guidance"""
-        guidance = f"Gospel Guidance on {spectrum.virtue_name}:\n\n"
-        guidance += f"📖 Christ's Example: {spectrum.gospel_connection}\n\n"
-        
         if position == SpectrumPosition.TEMPERANCE:
-            guidance += "✅ You're reflecting Christ's balanced approach to this virtue.\n"
-            guidance += "Continue to let the Spirit guide you in maintaining this balance.\n"
-        
+            body = _GUIDANCE_TEMPERATE
         elif position.value < 4:
-            guidance += f"🙏 Prayer Focus: Ask God to help you develop {spectrum.virtue_name.lower()}.\n"
-            guidance += f"📚 Study how Christ demonstrated {spectrum.virtue_name.lower()} in His life.\n"
-            guidance += "🛠️ Practice: Look for daily opportunities to grow in this virtue.\n"
-        
+            body = _GUIDANCE_DEFICIENT.format(virtue=spectrum.virtue_name.lower())
         else:
-            guidance += f"⚖️ Seek Balance: Even virtues need wisdom and moderation.\n"
-            guidance += f"🤔 Reflect: Is your {spectrum.virtue_name.lower()} serving others or becoming prideful?\n"
-            guidance += "📖 Remember: Christ was perfectly balanced in all virtues.\n"
-        
-        guidance += f"\n💡 Key Scripture: {spectrum.scripture_references[0] if spectrum.scripture_references else 'Study Christ\'s example'}"
+            body = _GUIDANCE_EXCESSIVE.format(virtue=spectrum.virtue_name.lower())
         
-        return guidance
+        return _GUIDANCE_TEMPLATE.format(
+            name=spectrum.virtue_name,
+            connection=spectrum.gospel_connection,
+            body=body,
+            scripture=spectrum.scripture_references[0] if spectrum.scripture_references else "Study Christ's example"
+        )
     
     def generate_virtue_report(self, person_description: str) -> str:
         """Generate comprehensive virtue analysis report"""
         analyses = self.analyze_virtue_spectrum(person_description)
         
-        report = "🌟 VIRTUE-VICE SPECTRUM ANALYSIS\n"
-        report += "=" * 50 + "\n\n"
-        
-        report += f"📝 ANALYZED: {person_description}\n\n"
+        parts = [_REPORT_HEADER, f"📝 ANALYZED: {person_description}\n\n"]
         
         if analyses:
             total_temperance_score = sum(4.0 - analysis.temperance_distance for analysis in analyses)
             max_possible = len(analyses) * 4.0
             overall_virtue_score = total_temperance_score / max_possible if max_possible > 0 else 0
             
-            report += f"🎯 OVERALL VIRTUE BALANCE: {overall_virtue_score:.2f}/1.0\n\n"
+            parts.append(f"🎯 OVERALL VIRTUE BALANCE: {overall_virtue_score:.2f}/1.0\n\n")
             
             for analysis in analyses:
-                report += f"⚖️ {analysis.virtue_spectrum.virtue_name.upper()} SPECTRUM:\n"
-                report += f"   Position: {analysis.position.name}\n"
-                report += f"   Distance from Temperance: {analysis.temperance_distance:.1f}\n"
-                report += f"   Deficiency Vice: {analysis.virtue_spectrum.deficiency_vice}\n"
-                report += f"   Excess Vice: {analysis.virtue_spectrum.excess_vice}\n\n"
-                
-                report += "💡 RECOMMENDATIONS:\n"
+                spectrum = analysis.virtue_spectrum
+                parts.append(
+                    f"⚖️ {spectrum.virtue_name.upper()} SPECTRUM:\n"
+                    f"   Position: {analysis.position.name}\n"
+                    f"   Distance from Temperance: {analysis.temperance_distance:.1f}\n"
+                    f"   Deficiency Vice: {spectrum.deficiency_vice}\n"
+                    f"   Excess Vice: {spectrum.excess_vice}\n\n"
+                    "💡 RECOMMENDATIONS:\n"
+                )
                 for rec in analysis.recommendations:
-                    report += f"   • {rec}\n"
-                report += "\n"
-                
-                report += f"📖 GOSPEL GUIDANCE:\n"
-                report += f"   {analysis.gospel_guidance}\n"
-                report += "-" * 40 + "\n\n"
+                    parts.append(f"   • {rec}\n")
+                parts.append(f"\n📖 GOSPEL GUIDANCE:\n   {analysis.gospel_guidance}\n")
+                parts.append(_SECTION_RULE)
         
-        report += "🎯 REMEMBER: The goal is temperance - virtue balanced with wisdom.\n"
-        report += "'In all things there must be moderation' - Gospel principle\n"
-        report += "Seek the Spirit to guide you toward Christ's perfect balance."
+        parts.append(_REPORT_FOOTER)
         
-        return report
+        return "".join(parts)
 
 # Example usage
 def demonstrate_virtue_spectrum():
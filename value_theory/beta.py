@@ -1,43 +1,69 @@
 import asyncio
 import platform
+from itertools import repeat
+from operator import itemgetter
 FPS = 60
+IS_PYODIDE = platform.system() == "Emscripten"  # Only the browser render loop needs frame pacing
 
 async def main():
     calc = ValueImpactCalculator()
     # Example usage: Compare Musk as President vs. running companies
-    pres_impact = await calc.calculate_impact(utility_per_person=362, num_people=345000000, growth_impact=0, opportunity_cost=15000000000)
-    comp_impact = await calc.calculate_impact(utility_per_person=500, num_people=100000000, growth_impact=0, opportunity_cost=0)
+    pres_impact, comp_impact = await asyncio.gather(
+        calc.calculate_impact(utility_per_person=362, num_people=345000000, growth_impact=0, opportunity_cost=15000000000),
+        calc.calculate_impact(utility_per_person=500, num_people=100000000, growth_impact=0, opportunity_cost=0)
+    )
     decision = calc.decide_best_option([("President", pres_impact), ("Companies", comp_impact)])
     print(f"Best option: {decision[0]} with impact ${decision[1]:,.2f}")
 
 class ValueImpactCalculator:
     def __init__(self):
         self.options = {}
+        self._option_params = {}  # name -> (utility_per_person, num_people, growth_impact, opportunity_cost)
 
-    async def calculate_impact(self, utility_per_person, num_people, growth_impact=0, opportunity_cost=0):
+    def _impact(self, utility_per_person, num_people, growth_impact=0, opportunity_cost=0):
         """Calculate total impact based on utility, people, growth, and opportunity cost."""
         base_impact = utility_per_person * num_people
         total_impact = base_impact + growth_impact - opportunity_cost
-        await asyncio.sleep(1.0 / FPS)  # Simulate frame rate control for Pyodide
         return max(0, total_impact)  # Ensure non-negative impact
 
-    def decide_best_option(self, options):
-        """Return the option with the highest impact."""
-        if not options:
+    async def calculate_impact(self, utility_per_person, num_people, growth_impact=0, opportunity_cost=0):
+        """Calculate impact, yielding one frame to the Pyodide render loop."""
+        impact = self._impact(utility_per_person, num_people, growth_impact, opportunity_cost)
+        if IS_PYODIDE:
+            await asyncio.sleep(1.0 / FPS)  # Frame rate control for Pyodide
+        return impact
+
+    def decide_best_option(self, options=None):
+        """Return the option with the highest impact, among the added options if none are given."""
+        if options is None:
+            # Score every added option in one batch call
+            names = list(self._option_params)
+            if not names:
+                return ("None", 0)
+            options = zip(names, self.calculate_impacts_batch(*zip(*self._option_params.values())))
+        elif not options:
             return ("None", 0)
-        best_option = max(options, key=lambda x: x[1])
+        best_option = max(options, key=itemgetter(1))
         return best_option
 
+    def calculate_impacts_batch(self, utilities_per_person, num_people, growth_impacts=None, opportunity_costs=None):
+        """Calculate impacts for many scenarios given as parallel sequences."""
+        if growth_impacts is None:
+            growth_impacts = repeat(0)
+        if opportunity_costs is None:
+            opportunity_costs = repeat(0)
+        return list(map(self._impact, utilities_per_person, num_people, growth_impacts, opportunity_costs))
+
     def add_option(self, name, utility_per_person, num_people, growth_impact=0, opportunity_cost=0):
         """Add an option for comparison."""
-        impact = asyncio.run(self.calculate_impact(utility_per_person, num_people, growth_impact, opportunity_cost))
-        self.options[name] = impact
+        self._option_params[name] = (utility_per_person, num_people, growth_impact, opportunity_cost)
+        self.options[name] = self._impact(utility_per_person, num_people, growth_impact, opportunity_cost)
 
     def get_all_impacts(self):
         """Return all calculated impacts."""
         return self.options
 
-if platform.system() == "Emscripten":
+if IS_PYODIDE:
     asyncio.ensure_future(main())
 else:
     if __name__ == "__main__":